@@ -1,11 +1,9 @@
 import streamlit as st
-import streamlit_authenticator as stauth
-import yaml
-from yaml.loader import SafeLoader
 
-from sections.agent_py_programmer import *
-from sections.chatbot import *
-from sections.software_engineer_basics import *
+from sections.auth import get_authenticator, rebuild_counters, save_account
+from sections.login import login
+from sections.registry import PAGES, first_load_ms, load_page
+from sections.session_memory import get_chat_memory
 
 # Set page configuration to collapse the sidebar by default
 st.set_page_config(
@@ -15,42 +13,38 @@ st.set_page_config(
     initial_sidebar_state="collapsed",  # This makes the sidebar collapsed by default
 )
 
-with open("config.yaml") as file:
-    config = yaml.load(file, Loader=SafeLoader)
+# Config, credentials (sections/user_store.py) and authenticator are cached
+# across reruns (see sections/auth.py)
+authenticator = get_authenticator()
 
-authenticator = stauth.Authenticate(
-    config["credentials"],
-    config["cookie"]["name"],
-    config["cookie"]["key"],
-    config["cookie"]["expiry_days"],
-)
-
-# Login
-authenticator.login()
+# Login (passwords are checked off the script thread, see sections/login.py)
+login(authenticator)
 
 # Authenticating users
 if st.session_state["authentication_status"]:
     authenticator.logout()
 
-    # Define available functions/subpages
-    page_names_to_funcs = {
-        "Software Engineer Basics": software_engineer_basics,
-        "Basic ChatGPT": run_chatbot,
-        "Python Agent": run_agent_py_programmer,
-    }
-
+    # Available subpages are listed in sections/registry.py and imported on demand
     # # Use keys to define buttons
     # demo_name = st.sidebar.radio(
-    #     "Choose a topic below:", key="visibility", options=page_names_to_funcs.keys()
+    #     "Choose a topic below:", key="visibility", options=PAGES.keys()
     # )
 
     # Convert radio button to a dropdown (selectbox)
     demo_name = st.sidebar.selectbox(
-        "Choose a topic below:", options=page_names_to_funcs.keys(), key="visibility"
+        "Choose a topic below:", options=PAGES.keys(), key="visibility"
     )
 
-    # Display pages
-    page_names_to_funcs[demo_name]()
+    # Display pages (the page module is imported the first time it is chosen)
+    load_page(demo_name)()
+
+    # Cache rebuild counters and each page's first load time (import and first
+    # render, ms), to watch under load
+    with st.sidebar.expander("Diagnostics"):
+        st.json(rebuild_counters)
+        st.json(first_load_ms)
+        # Bytes of chat history held by this process, against its budgets
+        st.json(get_chat_memory().stats())
 
 elif st.session_state["authentication_status"] is False:
     st.error("Username/password is incorrect")
@@ -60,53 +54,66 @@ elif st.session_state["authentication_status"] is None:
 # Sidebar content
 with st.sidebar:
 
-    # Setup / Account Management
-    with st.expander("Account🔒", expanded=False):
+    # Setup / Account Management: nothing below is built until the panel is
+    # opened, and then only the form the user picked
+    if st.toggle("Account🔒", value=False, key="show_account"):
+        account_actions = ["Register", "Forgot username", "Forgot password"]
+        if st.session_state["authentication_status"]:
+            account_actions.insert(0, "Reset password")
+        account_action = st.radio(
+            "Account action", account_actions, key="account_action"
+        )
 
         # Creating password
-        if st.session_state["authentication_status"]:
+        if account_action == "Reset password":
             try:
                 if authenticator.reset_password(st.session_state["username"]):
+                    save_account(authenticator, st.session_state["username"])
                     st.success("Password modified successfully")
             except Exception as e:
                 st.error(e)
 
         # Creating a new user registration
-        try:
-            (
-                email_of_registered_user,
-                username_of_registered_user,
-                name_of_registered_user,
-            ) = authenticator.register_user(pre_authorization=False)
-            if email_of_registered_user:
-                st.success("User registered successfully")
-        except Exception as e:
-            st.error(e)
+        elif account_action == "Register":
+            try:
+                (
+                    email_of_registered_user,
+                    username_of_registered_user,
+                    name_of_registered_user,
+                ) = authenticator.register_user(pre_authorization=False)
+                if email_of_registered_user:
+                    save_account(authenticator, username_of_registered_user)
+                    st.success("User registered successfully")
+            except Exception as e:
+                st.error(e)
 
         # Create a forgot username
-        try:
-            username_of_forgotten_username, email_of_forgotten_username = (
-                authenticator.forgot_username()
-            )
-            if username_of_forgotten_username:
-                st.success("Username to be sent securely")
-                # The developer should securely transfer the username to the user.
-            elif username_of_forgotten_username == False:
-                st.error("Email not found")
-        except Exception as e:
-            st.error(e)
+        elif account_action == "Forgot username":
+            try:
+                username_of_forgotten_username, email_of_forgotten_username = (
+                    authenticator.forgot_username()
+                )
+                if username_of_forgotten_username:
+                    st.success("Username to be sent securely")
+                    # The developer should securely transfer the username to the user.
+                elif username_of_forgotten_username == False:
+                    st.error("Email not found")
+            except Exception as e:
+                st.error(e)
 
         # Create a forgot password
-        try:
-            (
-                username_of_forgotten_password,
-                email_of_forgotten_password,
-                new_random_password,
-            ) = authenticator.forgot_password()
-            if username_of_forgotten_password:
-                st.success("New password to be sent securely")
-                # The developer should securely transfer the new password to the user.
-            elif username_of_forgotten_password == False:
-                st.error("Username not found")
-        except Exception as e:
-            st.error(e)
+        elif account_action == "Forgot password":
+            try:
+                (
+                    username_of_forgotten_password,
+                    email_of_forgotten_password,
+                    new_random_password,
+                ) = authenticator.forgot_password()
+                if username_of_forgotten_password:
+                    save_account(authenticator, username_of_forgotten_password)
+                    st.success("New password to be sent securely")
+                    # The developer should securely transfer the new password to the user.
+                elif username_of_forgotten_password == False:
+                    st.error("Username not found")
+            except Exception as e:
+                st.error(e)
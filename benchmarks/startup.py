@@ -0,0 +1,98 @@
+"""
+Cold-start benchmark: fresh interpreter to the first rendered login form.
+
+Runs app.py once in a new Python process under `-X importtime`, using
+Streamlit's AppTest so no browser or server is needed, and reports:
+
+- the wall time of the whole process (interpreter start, imports, first run),
+- the time of the first script run alone,
+- the slowest top-level imports by cumulative time.
+
+Usage (from the repository root):
+
+    python benchmarks/startup.py [--top 15]
+"""
+
+import argparse
+import os
+import subprocess
+import sys
+import time
+from typing import List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def run_child() -> None:
+    """Render app.py once and print how long the first run took."""
+    sys.path.insert(0, ROOT)
+    os.chdir(ROOT)
+    from streamlit.testing.v1 import AppTest
+
+    started = time.perf_counter()
+    at = AppTest.from_file(os.path.join(ROOT, "app.py"), default_timeout=60).run()
+    elapsed = time.perf_counter() - started
+
+    labels = [widget.label for widget in at.text_input]
+    if "Username" not in labels:
+        raise SystemExit(f"Login form was not rendered (text inputs: {labels})")
+    print(f"FIRST_RUN_SECONDS={elapsed:.4f}")
+
+
+def parse_importtime(stderr: str) -> List[Tuple[int, str]]:
+    """
+    Extract top-level imports and their cumulative time from `-X importtime` output.
+
+    :param stderr: The stderr of a process run with `-X importtime`.
+    :return: (cumulative microseconds, module) pairs for top-level imports.
+    """
+    imports = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:") :].split("|")
+        # Nested imports are indented under the module that pulled them in
+        if name.startswith("  "):
+            continue
+        imports.append((int(cumulative), name.strip()))
+    return imports
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--top", type=int, default=15, help="imports to list")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child()
+        return
+
+    started = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", os.path.abspath(__file__), "--child"],
+        capture_output=True,
+        text=True,
+        cwd=ROOT,
+    )
+    wall = time.perf_counter() - started
+    if result.returncode != 0:
+        sys.stderr.write(result.stdout + result.stderr[-4000:])
+        raise SystemExit(result.returncode)
+
+    first_run = next(
+        float(line.split("=", 1)[1])
+        for line in result.stdout.splitlines()
+        if line.startswith("FIRST_RUN_SECONDS=")
+    )
+    imports = sorted(parse_importtime(result.stderr), reverse=True)
+
+    print(f"Cold start to login form: {wall * 1000:8.1f} ms")
+    print(f"First script run:         {first_run * 1000:8.1f} ms")
+    print("\nSlowest top-level imports (cumulative):")
+    for cumulative, name in imports[: args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == "__main__":
+    main()
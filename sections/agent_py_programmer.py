@@ -1,79 +1,29 @@
 def run_agent_py_programmer():
-    import os
-    import re
+    import io
     from datetime import datetime
-    from typing import Any, Optional
+    from typing import Any, Iterator, List
 
     import streamlit as st
-    from dotenv import load_dotenv
-    from openai import OpenAI
-
-    # Load environment variables from .env file
-    load_dotenv()
-
-    # Access the API key from environment variables
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-
-    class ChatBot:
-        def __init__(self):
-            self.client = OpenAI(api_key=OPENAI_API_KEY)
-            self.history = [
-                {
-                    "role": "system",
-                    "content": "You are a helpful programmer especialy good for writing python code and functions. When user asks you to write py code or py functions or python functions, you always use standard format which includes type hints, docstring, and comments.",
-                }
-            ]
-
-        def generate_response(self, prompt: str) -> str:
-            self.history.append({"role": "user", "content": prompt})
-
-            completion = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",  # NOTE: feel free to change it to gpt-4, or gpt-4o
-                messages=self.history,
-            )
-
-            response = completion.choices[0].message.content
-            self.history.append({"role": "assistant", "content": response})
-
-            return response
-
-        def get_history(self) -> list:
-            return self.history
 
-    def isolate_and_save_python_code(
-        input_string: str, file_path: str
-    ) -> Optional[str]:
-        """
-        Extracts Python code from a given input string and saves it to a file.
-
-        This function looks for a block of text that is enclosed within triple backticks (```),
-        specifically targeting blocks that start with ```python.
-
-        Args:
-            input_string (str): The input string containing the Python code block.
-            file_path (str): The path where the extracted Python code will be saved.
-
-        Returns:
-            Optional[str]: The path to the saved file if the Python code block is found and saved, else None.
-        """
-        # Define the pattern to match the Python code block
-        pattern = r"```python\s*(.*?)\s*```"
-
-        # Search for the pattern in the input string
-        match = re.search(pattern, input_string, re.DOTALL)
-
-        if match:
-            # Extract the Python code
-            python_code = match.group(1)
-
-            # Write the Python code to the specified file
-            with open(file_path, "w") as file:
-                file.write(python_code)
-
-            return file_path
-        else:
-            # Return None if no Python code block is found
-            return None
+    from sections.artifacts import get_artifact_store
+    from sections.cache import CACHE_ENABLED, get_completion_cache
+    from sections.engine import ChatEngine
+    from sections.fences import (
+        CodeBlock,
+        FenceParser,
+        bundle_code_blocks,
+        file_extension,
+    )
+    from sections.session_store import (
+        HAS_OLDER_KEY,
+        clear_history,
+        load_older_history,
+        restore_history,
+        save_turn,
+    )
+    from sections.transcript import VISIBLE_MESSAGES_KEY, render_transcript
+
+    SYSTEM_PROMPT = "You are a helpful programmer especialy good for writing python code and functions. When user asks you to write py code or py functions or python functions, you always use standard format which includes type hints, docstring, and comments."
 
     import random
     import string
@@ -105,27 +55,42 @@ def run_agent_py_programmer():
         date_string = current_date.strftime("%Y_%m_%d")
         return date_string
 
-    def create_download_button(file_path: str) -> None:
+    def create_download_button(code_blocks: List[CodeBlock], stem: str) -> None:
         """
-        Create a download button for the saved Python code file.
+        Create a download button for the code blocks of a response.
+
+        A single block is offered as one file, several blocks as one zip.
 
-        :param file_path: The path to the Python file to be downloaded.
+        :param code_blocks: The fenced code blocks, in order.
+        :param stem: The file name without extension.
         """
-        # Read the content of the saved file
-        with open(file_path, "r") as file:
-            file_content = file.read()
+        if len(code_blocks) == 1:
+            block = code_blocks[0]
+            extension = file_extension(block.language)
+            label = "Download Python Script" if extension == "py" else "Download Code"
+            file_name = f"{stem}.{extension}"
+            buffer = io.BytesIO(block.code.encode("utf-8"))
+            mime = "text/plain"
+        else:
+            label = f"Download All {len(code_blocks)} Code Blocks (zip)"
+            file_name = f"{stem}.zip"
+            buffer = bundle_code_blocks(code_blocks, stem)
+            mime = "application/zip"
+
+        # Opt-in: keep a copy in the bounded, TTL-swept artifact directory
+        artifact_store = get_artifact_store()
+        if artifact_store is not None:
+            artifact_store.save(file_name, buffer.getvalue())
 
         # Create a download button in Streamlit
-        st.download_button(
-            label="Download Python Script",
-            data=file_content,
-            file_name=file_path.split("/")[-1],  # Use the file name from the path
-            mime="text/plain",
-        )
+        st.download_button(label=label, data=buffer, file_name=file_name, mime=mime)
 
     # st.set_page_config(layout="wide")
     st.title("Just chat! 🤖")
 
+    # Chat history is stored server-side per user
+    username = st.session_state["username"]
+
     with st.sidebar:
         with st.expander("Instruction Manual"):
             st.markdown(
@@ -153,9 +118,17 @@ def run_agent_py_programmer():
 
         # Add a button to clear the session state
         if st.button("Clear Session"):
-            st.session_state.messages = []
+            clear_history(st.session_state, username)
+            st.session_state.pop(VISIBLE_MESSAGES_KEY, None)
             st.experimental_rerun()
 
+        # Opt-in cache for repeated prompts, with counters for operators
+        use_cache = st.toggle(
+            "Use response cache", value=CACHE_ENABLED, key="use_response_cache"
+        )
+        with st.expander("Response cache stats"):
+            st.json(get_completion_cache().stats())
+
         # Credit:
         current_year = datetime.now().year  # This will print the current year
         st.markdown(
@@ -165,21 +138,28 @@ def run_agent_py_programmer():
             unsafe_allow_html=True,
         )
 
-    # Initialize chat history
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-
-    # Ensure messages are a list of dictionaries
-    if not isinstance(st.session_state.messages, list):
-        st.session_state.messages = []
-    if not all(isinstance(msg, dict) for msg in st.session_state.messages):
-        st.session_state.messages = []
-
-    # Display chat messages from history on app rerun, excluding system messages
-    for message in st.session_state.messages:
-        if message["role"] != "system":  # Skip displaying system messages
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
+    # Initialize chat history with the user's most recent stored messages (also
+    # replaces a malformed history, or one evicted under memory pressure)
+    restore_history(st.session_state, username)
+
+    engine = ChatEngine(
+        system_prompt=f"{SYSTEM_PROMPT} Year now is {current_year}",
+        cache=get_completion_cache() if use_cache else None,
+    )
+
+    # Keep exactly one system prompt per conversation (collapses the per-turn
+    # system messages that older sessions accumulated)
+    engine.sync_system_prompt(st.session_state.messages)
+
+    # Display the recent chat messages on app rerun, older ones on demand
+    render_transcript(
+        st.session_state.messages,
+        load_older=(
+            (lambda: load_older_history(st.session_state, username))
+            if st.session_state.get(HAS_OLDER_KEY)
+            else None
+        ),
+    )
 
     # React to user input
     if prompt := st.chat_input(
@@ -189,37 +169,55 @@ def run_agent_py_programmer():
         # Display user message in chat message container
         st.chat_message("user").markdown(prompt)
 
-        # Add a system message to the chat history, but don't display it
-        st.session_state.messages.append(
-            {
-                "role": "system",
-                "content": f"You are a helpful assistant. Year now is {current_year}",
-            }
-        )
+        # API Call: the engine sends a token-budgeted window of the history
+        history = list(st.session_state.messages)
 
-        # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
+        # Collect every fenced code block while the response streams past
+        code_blocks: List[CodeBlock] = []
 
-        # API Call
-        bot = ChatBot()
-        bot.history = st.session_state.messages.copy()  # Update history from messages
-        response = bot.generate_response(prompt)
+        def collect_code_blocks(deltas: Iterator[str]) -> Iterator[str]:
+            parser = FenceParser()
+            for delta in deltas:
+                code_blocks.extend(parser.feed(delta))
+                yield delta
+            code_blocks.extend(parser.close())
 
-        # Display assistant response in chat message container
+        # Stream assistant response into the chat message container as it arrives
+        turn_metrics = {}
         with st.chat_message("assistant"):
-            st.markdown(response)
+            # Updated while the model is silent: each update is also a point
+            # where Streamlit can interrupt this run for a newer one
+            waiting = st.empty()
+
+            def show_waiting(seconds: float) -> None:
+                waiting.caption(f"⏳ Waiting for the model... {seconds:.0f}s")
+
+            try:
+                response = st.write_stream(
+                    collect_code_blocks(
+                        engine.stream(
+                            history, prompt, st.session_state, turn_metrics, show_waiting
+                        )
+                    )
+                )
+            except Exception as e:
+                # Retries are exhausted or the circuit breaker is open
+                waiting.empty()
+                st.error(f"Sorry, the model could not answer right now: {e}")
+                return
+            waiting.empty()
+            st.caption(
+                f"System prompt tokens saved: {turn_metrics['system_tokens_saved']}"
+            )
 
-        # Add assistant response to chat history
+        # Add the turn to chat history only once it has a reply, so a failed or
+        # interrupted stream leaves no unanswered prompt behind; then persist it
+        st.session_state.messages.append({"role": "user", "content": prompt})
         st.session_state.messages.append({"role": "assistant", "content": response})
+        save_turn(st.session_state, username)
 
-        # Check if we need to save py script
-        if "```python" in response:
+        # Offer the code blocks for download
+        if code_blocks:
             random_string = generate_random_string().lower()
             date_string = get_current_date_string()
-            this_py_script_name = f"{date_string}_{random_string}.py"
-            isolate_and_save_python_code(
-                input_string=response, file_path=this_py_script_name
-            )
-
-            # Create a download button
-            create_download_button(this_py_script_name)
+            create_download_button(code_blocks, f"{date_string}_{random_string}")
@@ -0,0 +1,396 @@
+"""
+The algorithm snippets of the Software Engineer Basics guide, as real code.
+
+The teaching implementations below are copied from the guide as written. The
+`CATALOGUE` pairs each one with an input generator, the input sizes to time
+it on, the complexity the guide states for it, and the guide sections that
+show it. `time_sweep` measures an algorithm across its sizes; the page runs
+it in the sandboxed pool of sections/sandbox.py.
+"""
+
+import random
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Each size is timed at most this long; larger sizes are skipped after that
+SWEEP_MAX_SECONDS_PER_SIZE = 2.0
+# Calls of fast algorithms are repeated until a measurement takes this long
+_MIN_MEASURE_SECONDS = 0.002
+
+
+def get_element(arr, index):
+    return arr[index]
+
+
+def binary_search(arr, x):
+    l, r = 0, len(arr) - 1
+    while l <= r:
+        mid = (l + r) // 2
+        if arr[mid] == x:
+            return mid
+        elif arr[mid] < x:
+            l = mid + 1
+        else:
+            r = mid - 1
+    return -1
+
+
+def find_max(arr):
+    maximum = arr[0]
+    for num in arr:
+        if num > maximum:
+            maximum = num
+    return maximum
+
+
+def merge_sort(arr):
+    if len(arr) <= 1:
+        return arr
+    mid = len(arr) // 2
+    left = merge_sort(arr[:mid])
+    right = merge_sort(arr[mid:])
+    return merge(left, right)
+
+
+def merge(left, right):
+    result = []
+    i = j = 0
+    while i < len(left) and j < len(right):
+        if left[i] < right[j]:
+            result.append(left[i])
+            i += 1
+        else:
+            result.append(right[j])
+            j += 1
+    result.extend(left[i:])
+    result.extend(right[j:])
+    return result
+
+
+def bubble_sort(arr):
+    n = len(arr)
+    for i in range(n):
+        for j in range(0, n - i - 1):
+            if arr[j] > arr[j + 1]:
+                arr[j], arr[j + 1] = arr[j + 1], arr[j]
+    return arr
+
+
+def quick_sort(arr):
+    if len(arr) <= 1:
+        return arr
+    pivot = arr[len(arr) // 2]
+    left = [x for x in arr if x < pivot]
+    middle = [x for x in arr if x == pivot]
+    right = [x for x in arr if x > pivot]
+    return quick_sort(left) + middle + quick_sort(right)
+
+
+def counting_sort_for_radix(arr, position):
+    size = len(arr)
+    output = [0] * size
+    count = [0] * 10
+
+    for i in range(size):
+        index = arr[i] // position % 10
+        count[index] += 1
+
+    for i in range(1, 10):
+        count[i] += count[i - 1]
+
+    i = size - 1
+    while i >= 0:
+        index = arr[i] // position % 10
+        output[count[index] - 1] = arr[i]
+        count[index] -= 1
+        i -= 1
+
+    for i in range(size):
+        arr[i] = output[i]
+
+
+def radix_sort(arr):
+    max_num = max(arr)
+    position = 1
+    while max_num // position > 0:
+        counting_sort_for_radix(arr, position)
+        position *= 10
+    return arr
+
+
+def bucket_sort(arr):
+    if len(arr) == 0:
+        return arr
+
+    min_val, max_val = min(arr), max(arr)
+    bucket_range = (max_val - min_val) / len(arr)
+    buckets = [[] for _ in range(len(arr) + 1)]
+
+    for num in arr:
+        buckets[int((num - min_val) / bucket_range)].append(num)
+
+    sorted_arr = []
+    for bucket in buckets:
+        sorted_arr.extend(sorted(bucket))
+
+    return sorted_arr
+
+
+def fibonacci(n):
+    if n <= 1:
+        return n
+    return fibonacci(n - 1) + fibonacci(n - 2)
+
+
+def permutations(lst):
+    if len(lst) == 0:
+        return [[]]
+    perms = []
+    for i in range(len(lst)):
+        rest = lst[:i] + lst[i + 1 :]
+        for p in permutations(rest):
+            perms.append([lst[i]] + p)
+    return perms
+
+
+def coin_change(coins, amount):
+    coins.sort(reverse=True)
+    count = 0
+    for coin in coins:
+        if amount == 0:
+            break
+        num_coins = amount // coin
+        count += num_coins
+        amount -= coin * num_coins
+    return count if amount == 0 else -1
+
+
+# Input generators: (n, random source) -> positional arguments
+
+
+def random_integers(n: int, rng: random.Random) -> Tuple[list]:
+    # Fixed-width keys (6 digits), so radix sort makes the same number of passes
+    return ([rng.randrange(10**6) for _ in range(n)],)
+
+
+def sorted_integers_and_position(n: int, rng: random.Random) -> Tuple[list, int]:
+    # Also a valid target value, as the list holds 0..n-1
+    return list(range(n)), rng.randrange(n)
+
+
+def integer(n: int, rng: random.Random) -> Tuple[int]:
+    return (n,)
+
+
+def integer_list(n: int, rng: random.Random) -> Tuple[list]:
+    return (list(range(n)),)
+
+
+def coins_and_amount(n: int, rng: random.Random) -> Tuple[list, int]:
+    # n coin denominations, always including 1 so every amount can be paid
+    coins = [1] + rng.sample(range(2, 100 * n), n - 1)
+    return coins, rng.randrange(10**6)
+
+
+def geometric_sizes(start: int, factor: int, count: int) -> Tuple[int, ...]:
+    """
+    Return `count` input sizes growing by `factor`, e.g. 1000, 4000, 16000.
+
+    :param start: The first size.
+    :param factor: The ratio between consecutive sizes.
+    :param count: The number of sizes.
+    :return: The sizes.
+    """
+    return tuple(start * factor**i for i in range(count))
+
+
+class Algorithm(NamedTuple):
+    name: str
+    function: Callable
+    make_args: Callable[[int, random.Random], tuple]
+    sizes: Tuple[int, ...]
+    notation: Optional[str]  # As stated in the guide, None if it states none
+    sections: Tuple[str, ...]  # Keys of the guide sections showing it
+    mutates: bool = False  # Whether it modifies its input in place
+
+
+_GEOMETRIC_LARGE = geometric_sizes(1000, 4, 6)
+_GEOMETRIC_SORT = geometric_sizes(1000, 2, 7)
+_BIG_O = "big-o/big-o-notations-and-examples"
+
+CATALOGUE: Dict[str, Algorithm] = {
+    algorithm.name: algorithm
+    for algorithm in (
+        Algorithm(
+            "get_element",
+            get_element,
+            sorted_integers_and_position,
+            _GEOMETRIC_LARGE,
+            "O(1)",
+            (_BIG_O,),
+        ),
+        Algorithm(
+            "binary_search",
+            binary_search,
+            sorted_integers_and_position,
+            _GEOMETRIC_LARGE,
+            "O(log n)",
+            (_BIG_O, "search"),
+        ),
+        Algorithm(
+            "find_max",
+            find_max,
+            random_integers,
+            geometric_sizes(1000, 4, 5),
+            "O(n)",
+            (_BIG_O, "arrays"),
+        ),
+        Algorithm(
+            "merge_sort",
+            merge_sort,
+            random_integers,
+            _GEOMETRIC_SORT,
+            "O(n log n)",
+            (_BIG_O, "sorting/more-in-sorting"),
+        ),
+        Algorithm(
+            "quick_sort",
+            quick_sort,
+            random_integers,
+            _GEOMETRIC_SORT,
+            "O(n log n)",
+            ("sorting/more-in-sorting",),
+        ),
+        Algorithm(
+            "radix_sort",
+            radix_sort,
+            random_integers,
+            _GEOMETRIC_SORT,
+            # O(nk) with k digits; the generated keys have a fixed k
+            "O(n)",
+            ("sorting/more-in-sorting",),
+            mutates=True,
+        ),
+        Algorithm(
+            "bucket_sort",
+            bucket_sort,
+            random_integers,
+            _GEOMETRIC_SORT,
+            # O(n + n^2/k + k) with k = n buckets, on uniformly spread keys
+            "O(n)",
+            ("sorting/more-in-sorting",),
+        ),
+        Algorithm(
+            "bubble_sort",
+            bubble_sort,
+            random_integers,
+            geometric_sizes(100, 2, 5),
+            "O(n^2)",
+            (_BIG_O, "sorting", "sorting/more-in-sorting"),
+            mutates=True,
+        ),
+        Algorithm(
+            "fibonacci",
+            fibonacci,
+            integer,
+            # Super-polynomial: n itself grows linearly, the work geometrically
+            (10, 12, 14, 16, 18, 20, 22, 24),
+            "O(2^n)",
+            (_BIG_O, "recursion/fibonacci-number"),
+        ),
+        Algorithm(
+            "permutations",
+            permutations,
+            integer_list,
+            (3, 4, 5, 6, 7, 8),
+            "O(n!)",
+            (_BIG_O,),
+        ),
+        Algorithm(
+            "coin_change",
+            coin_change,
+            coins_and_amount,
+            geometric_sizes(10, 4, 6),
+            None,
+            ("greedy-algorithms",),
+            mutates=True,
+        ),
+    )
+}
+
+
+def algorithms_for_section(section_key: str) -> List[Algorithm]:
+    """
+    List the catalogued algorithms shown in a guide section.
+
+    :param section_key: The key of a guide section.
+    :return: The algorithms, in catalogue order.
+    """
+    return [a for a in CATALOGUE.values() if section_key in a.sections]
+
+
+def measure(algorithm: Algorithm, n: int, repeats: int = 3, seed: int = 0) -> float:
+    """
+    Time one call of an algorithm on an input of size n.
+
+    Inputs are generated outside the timed region. Fast calls are repeated
+    until a measurement is long enough for the clock, and the best of
+    `repeats` measurements is kept.
+
+    Args:
+        algorithm (Algorithm): The catalogued algorithm.
+        n (int): The input size.
+        repeats (int): The number of measurements.
+        seed (int): The seed of the input generator.
+
+    Returns:
+        float: Seconds per call.
+    """
+    rng = random.Random(seed)
+    best = float("inf")
+    for _ in range(repeats):
+        args = algorithm.make_args(n, rng)
+        if algorithm.mutates:
+            # A second call would see already sorted input
+            started = time.perf_counter()
+            algorithm.function(*args)
+            best = min(best, time.perf_counter() - started)
+            continue
+
+        number = 1
+        while True:
+            started = time.perf_counter()
+            for _ in range(number):
+                algorithm.function(*args)
+            elapsed = time.perf_counter() - started
+            if elapsed >= _MIN_MEASURE_SECONDS:
+                break
+            number *= 10
+        best = min(best, elapsed / number)
+    return best
+
+
+def time_sweep(
+    name: str, sizes: Optional[Tuple[int, ...]] = None, repeats: int = 3
+) -> List[Tuple[int, float]]:
+    """
+    Time a catalogued algorithm on growing input sizes.
+
+    Stops early once one size takes longer than `SWEEP_MAX_SECONDS_PER_SIZE`.
+
+    Args:
+        name (str): The algorithm's name in `CATALOGUE`.
+        sizes (Optional[Tuple[int, ...]]): Input sizes, the catalogue's if None.
+        repeats (int): Measurements per size.
+
+    Returns:
+        List[Tuple[int, float]]: (n, seconds per call) for each timed size.
+    """
+    algorithm = CATALOGUE[name]
+    timings = []
+    for n in sizes or algorithm.sizes:
+        seconds = measure(algorithm, n, repeats)
+        timings.append((n, seconds))
+        if seconds * repeats > SWEEP_MAX_SECONDS_PER_SIZE:
+            break
+    return timings
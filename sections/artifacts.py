@@ -0,0 +1,104 @@
+import os
+import tempfile
+import threading
+import time
+from typing import Optional
+
+# Generated files are only kept on disk when this is enabled
+ARTIFACTS_PERSIST = os.getenv("ARTIFACTS_PERSIST", "0") == "1"
+ARTIFACTS_DIR = os.getenv("ARTIFACTS_DIR", "artifacts")
+ARTIFACTS_MAX_FILES = int(os.getenv("ARTIFACTS_MAX_FILES", "200"))
+ARTIFACTS_MAX_BYTES = int(os.getenv("ARTIFACTS_MAX_BYTES", str(50 * 1024 * 1024)))
+ARTIFACTS_TTL_SECONDS = float(os.getenv("ARTIFACTS_TTL_SECONDS", "86400"))
+
+
+class ArtifactStore:
+    """
+    A directory of generated files, bounded in count, size and age.
+
+    Every write sweeps the directory: expired files are deleted first, then
+    the oldest ones until the count and size limits hold again.
+    """
+
+    def __init__(
+        self,
+        directory: str = ARTIFACTS_DIR,
+        max_files: int = ARTIFACTS_MAX_FILES,
+        max_bytes: int = ARTIFACTS_MAX_BYTES,
+        ttl_seconds: float = ARTIFACTS_TTL_SECONDS,
+    ):
+        self.directory = directory
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._lock = threading.Lock()
+        os.makedirs(directory, exist_ok=True)
+
+    def save(self, file_name: str, data: bytes) -> str:
+        """
+        Write one artifact, then sweep the directory.
+
+        :param file_name: The file name (any directory part is ignored).
+        :param data: The file content.
+        :return: The path of the written file.
+        """
+        path = os.path.join(self.directory, os.path.basename(file_name))
+        # Write to a temporary file first so readers never see a partial file
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(tmp_path, path)
+        self.sweep()
+        return path
+
+    def sweep(self) -> int:
+        """
+        Delete expired files, then the oldest files beyond the limits.
+
+        :return: The number of files deleted.
+        """
+        with self._lock:
+            now = time.time()
+            entries = []
+            for entry in os.scandir(self.directory):
+                if entry.is_file() and not entry.name.endswith(".tmp"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+            entries.sort()  # Oldest first
+
+            total = sum(size for _, size, _ in entries)
+            deleted = 0
+            for mtime, size, path in entries:
+                if (
+                    now - mtime <= self.ttl_seconds
+                    and len(entries) - deleted <= self.max_files
+                    and total <= self.max_bytes
+                ):
+                    break
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass  # Another process swept it first
+                total -= size
+                deleted += 1
+            return deleted
+
+
+_store: Optional[ArtifactStore] = None
+_store_lock = threading.Lock()
+
+
+def get_artifact_store() -> Optional[ArtifactStore]:
+    """
+    Return the process-wide artifact store, or None if persistence is off.
+
+    :return: The shared store when `ARTIFACTS_PERSIST=1`, else None.
+    """
+    global _store
+    if not ARTIFACTS_PERSIST:
+        return None
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                _store = ArtifactStore()
+    return _store
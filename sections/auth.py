@@ -0,0 +1,117 @@
+import os
+from typing import Dict
+
+import streamlit as st
+import streamlit_authenticator as stauth
+import yaml
+from yaml.loader import SafeLoader
+
+from sections.user_store import AUTH_CONFIG_PATH as CONFIG_PATH
+from sections.user_store import get_credential_backend
+
+# How often each cached object had to be rebuilt in this process
+rebuild_counters: Dict[str, int] = {
+    "config": 0,
+    "credentials": 0,
+    "authenticator": 0,
+}
+
+# Session state keys of the per-session authenticator cache
+_AUTHENTICATOR_KEY = "_authenticator"
+_AUTHENTICATOR_VERSION_KEY = "_authenticator_version"
+
+
+@st.cache_resource(show_spinner=False, max_entries=4)
+def _load_config(path: str, mtime_ns: int) -> dict:
+    """
+    Parse the YAML config; cached per (path, modification time).
+
+    :param path: The path to the config file.
+    :param mtime_ns: The file's modification time, part of the cache key only.
+    :return: The parsed config, shared by every session of the process.
+    """
+    rebuild_counters["config"] += 1
+    with open(path) as file:
+        return yaml.load(file, Loader=SafeLoader)
+
+
+def get_config(path: str = CONFIG_PATH) -> dict:
+    """
+    Return the parsed config, re-reading the file only when it changed on disk.
+
+    :param path: The path to the config file.
+    :return: The parsed config.
+    """
+    return _load_config(path, os.stat(path).st_mtime_ns)
+
+
+@st.cache_resource(show_spinner=False, max_entries=2)
+def _load_credentials(version: int) -> dict:
+    """
+    Load every user from the credential backend; cached per backend version.
+
+    `stauth.Authenticate` only works on a dictionary of every user, so the
+    authenticator (cookie login, registration, password resets) still loads
+    the whole table again after each write. The login form looks users up
+    one at a time through the backend instead.
+
+    :param version: The backend's write version, part of the cache key only.
+    :return: The credentials, shared by every session of the process.
+    """
+    rebuild_counters["credentials"] += 1
+    return get_credential_backend().load_credentials()
+
+
+def save_account(authenticator: stauth.Authenticate, username: str) -> None:
+    """
+    Persist one user after the authenticator changed it in memory.
+
+    Registration and password resets only update the credentials dictionary
+    the authenticator was built with; this writes the user's new record from
+    that dictionary to the credential backend. (Re-reading the backend's
+    credentials instead would miss the change if another session had written
+    a user in the meantime.)
+
+    :param authenticator: The session's authenticator that made the change.
+    :param username: The user that was registered or updated.
+    """
+    model = authenticator.authentication_controller.authentication_model
+    user = model.credentials["usernames"].get(username)
+    if user is not None:
+        get_credential_backend().save_user(username, user)
+
+
+def get_authenticator(path: str = CONFIG_PATH) -> stauth.Authenticate:
+    """
+    Return the session's authenticator, building it only when needed.
+
+    The authenticator reads the login cookie through a component when it is
+    constructed, so it is rebuilt on every rerun until the user is logged in.
+    From then on the same object is reused for the rest of the session, unless
+    the config file or the credential store changes.
+
+    :param path: The path to the config file.
+    :return: The authenticator for the current session.
+    """
+    version = (os.stat(path).st_mtime_ns, get_credential_backend().version())
+    authenticator = st.session_state.get(_AUTHENTICATOR_KEY)
+    if (
+        authenticator is not None
+        and st.session_state.get("authentication_status")
+        and st.session_state.get(_AUTHENTICATOR_VERSION_KEY) == version
+    ):
+        return authenticator
+
+    config = _load_config(path, version[0])
+    authenticator = stauth.Authenticate(
+        _load_credentials(version[1]),
+        config["cookie"]["name"],
+        config["cookie"]["key"],
+        config["cookie"]["expiry_days"],
+        # The credential store only holds bcrypt hashes
+        auto_hash=False,
+    )
+    rebuild_counters["authenticator"] += 1
+    st.session_state[_AUTHENTICATOR_KEY] = authenticator
+    st.session_state[_AUTHENTICATOR_VERSION_KEY] = version
+    return authenticator
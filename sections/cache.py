@@ -0,0 +1,204 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
+
+# Response cache settings, overridable from the environment
+CACHE_ENABLED = os.getenv("CHAT_CACHE_ENABLED", "0") == "1"
+CACHE_MAX_ENTRIES = int(os.getenv("CHAT_CACHE_MAX_ENTRIES", "512"))
+CACHE_TTL = float(os.getenv("CHAT_CACHE_TTL", "3600"))
+CACHE_DB_PATH = os.getenv("CHAT_CACHE_DB")  # Optional on-disk SQLite tier
+CACHE_DB_MAX_ENTRIES = int(os.getenv("CHAT_CACHE_DB_MAX_ENTRIES", "10000"))
+
+# How many disk writes happen between two eviction sweeps of the SQLite tier
+_DB_SWEEP_EVERY = 64
+
+
+def make_cache_key(model: str, messages: List[dict], **params) -> str:
+    """
+    Build the cache key for a completion request.
+
+    Message text is whitespace-normalized so that trivially different prompts
+    ("What is  LLM? " and "What is LLM?") share an entry.
+
+    Args:
+        model (str): The model name.
+        messages (List[dict]): The messages sent to the model.
+        **params: Any other request parameters that change the answer.
+
+    Returns:
+        str: A hex SHA-256 digest identifying the request.
+    """
+    normalized = [
+        {"role": m["role"], "content": " ".join(m["content"].split())}
+        for m in messages
+    ]
+    payload = json.dumps(
+        {"model": model, "messages": normalized, "params": params}, sort_keys=True
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class CompletionCache:
+    """
+    Two-tier completion cache: an in-memory LRU in front of an optional SQLite file.
+
+    Entries expire after `ttl` seconds in both tiers. The memory tier holds at
+    most `max_entries` entries, the disk tier at most `db_max_entries`.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        ttl: float = CACHE_TTL,
+        db_path: Optional[str] = CACHE_DB_PATH,
+        db_max_entries: int = CACHE_DB_MAX_ENTRIES,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.db_max_entries = db_max_entries
+        self._memory: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db: Optional[sqlite3.Connection] = None
+        self._db_writes = 0
+        self.counters: Dict[str, int] = {
+            "memory_hits": 0,
+            "disk_hits": 0,
+            "misses": 0,
+            "evictions": 0,
+        }
+        if db_path:
+            self._db = sqlite3.connect(db_path, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS completions ("
+                "key TEXT PRIMARY KEY, response TEXT NOT NULL, "
+                "created REAL NOT NULL, accessed REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS completions_accessed "
+                "ON completions (accessed)"
+            )
+            self._db.commit()
+
+    def get(self, key: str) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        :param key: The key from `make_cache_key`.
+        :return: The cached response text, or None on a miss or expired entry.
+        """
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(key)
+            if entry is not None:
+                created, response = entry
+                if now - created <= self.ttl:
+                    self._memory.move_to_end(key)
+                    self.counters["memory_hits"] += 1
+                    return response
+                del self._memory[key]
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT response, created FROM completions WHERE key = ?", (key,)
+                ).fetchone()
+                if row is not None and now - row[1] <= self.ttl:
+                    self._db.execute(
+                        "UPDATE completions SET accessed = ? WHERE key = ?", (now, key)
+                    )
+                    self._db.commit()
+                    # Promote to the memory tier
+                    self._store_in_memory(key, row[1], row[0])
+                    self.counters["disk_hits"] += 1
+                    return row[0]
+
+            self.counters["misses"] += 1
+            return None
+
+    def put(self, key: str, response: str) -> None:
+        """
+        Store a response in every enabled tier.
+
+        :param key: The key from `make_cache_key`.
+        :param response: The full response text.
+        """
+        now = time.time()
+        with self._lock:
+            self._store_in_memory(key, now, response)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?)",
+                    (key, response, now, now),
+                )
+                self._db_writes += 1
+                if self._db_writes % _DB_SWEEP_EVERY == 0:
+                    self._sweep_db(now)
+                self._db.commit()
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters and the current size of each tier.
+
+        :return: A dictionary of counters suitable for display.
+        """
+        with self._lock:
+            stats = dict(self.counters)
+            stats["memory_entries"] = len(self._memory)
+            if self._db is not None:
+                stats["disk_entries"] = self._db.execute(
+                    "SELECT COUNT(*) FROM completions"
+                ).fetchone()[0]
+        return stats
+
+    def clear(self) -> None:
+        """Drop every entry from both tiers."""
+        with self._lock:
+            self._memory.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM completions")
+                self._db.commit()
+
+    def _store_in_memory(self, key: str, created: float, response: str) -> None:
+        # Caller holds the lock
+        self._memory[key] = (created, response)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.counters["evictions"] += 1
+
+    def _sweep_db(self, now: float) -> None:
+        # Caller holds the lock: drop expired rows, then the least recently used overflow
+        cursor = self._db.execute(
+            "DELETE FROM completions WHERE created < ?", (now - self.ttl,)
+        )
+        evicted = cursor.rowcount
+        cursor = self._db.execute(
+            "DELETE FROM completions WHERE key IN ("
+            "SELECT key FROM completions ORDER BY accessed DESC LIMIT -1 OFFSET ?)",
+            (self.db_max_entries,),
+        )
+        evicted += cursor.rowcount
+        self.counters["evictions"] += max(evicted, 0)
+
+
+_cache: Optional[CompletionCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_completion_cache() -> CompletionCache:
+    """
+    Return the process-wide completion cache, creating it on first use.
+
+    :return: The shared cache.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = CompletionCache()
+    return _cache
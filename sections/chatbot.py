@@ -1,43 +1,26 @@
 def run_chatbot():
-    import os
     from datetime import datetime
 
     import streamlit as st
-    from dotenv import load_dotenv
-    from openai import OpenAI
 
-    # Load environment variables from .env file
-    load_dotenv()
-
-    # Access the API key from environment variables
-    OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-
-    class ChatBot:
-        def __init__(self):
-            self.client = OpenAI(api_key=OPENAI_API_KEY)
-            self.history = [
-                {"role": "system", "content": "You are a helpful assistant."}
-            ]
-
-        def generate_response(self, prompt: str) -> str:
-            self.history.append({"role": "user", "content": prompt})
-
-            completion = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",  # NOTE: feel free to change it to gpt-4, or gpt-4o
-                messages=self.history,
-            )
-
-            response = completion.choices[0].message.content
-            self.history.append({"role": "assistant", "content": response})
-
-            return response
-
-        def get_history(self) -> list:
-            return self.history
+    from sections.cache import CACHE_ENABLED, get_completion_cache
+    from sections.engine import ChatEngine
+    from sections.session_store import (
+        HAS_OLDER_KEY,
+        clear_history,
+        load_older_history,
+        restore_history,
+        save_turn,
+    )
+    from sections.semantic_cache import SEMANTIC_CACHE_ENABLED, get_semantic_cache
+    from sections.transcript import VISIBLE_MESSAGES_KEY, render_transcript
 
     # st.set_page_config(layout="wide")
     st.title("Just chat! 🤖")
 
+    # Chat history is stored server-side per user
+    username = st.session_state["username"]
+
     with st.sidebar:
         with st.expander("Instruction Manual"):
             st.markdown(
@@ -65,9 +48,23 @@ def run_chatbot():
 
         # Add a button to clear the session state
         if st.button("Clear Session"):
-            st.session_state.messages = []
+            clear_history(st.session_state, username)
+            st.session_state.pop(VISIBLE_MESSAGES_KEY, None)
             st.experimental_rerun()
 
+        # Opt-in cache for repeated prompts, with counters for operators
+        use_cache = st.toggle(
+            "Use response cache", value=CACHE_ENABLED, key="use_response_cache"
+        )
+        use_semantic_cache = st.toggle(
+            "Reuse answers to similar prompts",
+            value=SEMANTIC_CACHE_ENABLED,
+            key="use_semantic_cache",
+        )
+        with st.expander("Response cache stats"):
+            st.json(get_completion_cache().stats())
+            st.json(get_semantic_cache().stats())
+
         # Credit:
         current_year = datetime.now().year  # This will print the current year
         st.markdown(
@@ -77,21 +74,36 @@ def run_chatbot():
             unsafe_allow_html=True,
         )
 
-    # Initialize chat history
-    if "messages" not in st.session_state:
-        st.session_state.messages = []
-
-    # Ensure messages are a list of dictionaries
-    if not isinstance(st.session_state.messages, list):
-        st.session_state.messages = []
-    if not all(isinstance(msg, dict) for msg in st.session_state.messages):
-        st.session_state.messages = []
-
-    # Display chat messages from history on app rerun, excluding system messages
-    for message in st.session_state.messages:
-        if message["role"] != "system":  # Skip displaying system messages
-            with st.chat_message(message["role"]):
-                st.markdown(message["content"])
+    # Initialize chat history with the user's most recent stored messages (also
+    # replaces a malformed history, or one evicted under memory pressure)
+    restore_history(st.session_state, username)
+
+    def record_latency(metrics: dict) -> None:
+        # Keep per-turn latency for this session
+        if "latencies" not in st.session_state:
+            st.session_state.latencies = []
+        st.session_state.latencies.append(metrics)
+
+    engine = ChatEngine(
+        system_prompt=f"You are a helpful assistant. Year now is {current_year}",
+        cache=get_completion_cache() if use_cache else None,
+        semantic_cache=get_semantic_cache() if use_semantic_cache else None,
+        hooks=[record_latency],
+    )
+
+    # Keep exactly one system prompt per conversation (collapses the per-turn
+    # system messages that older sessions accumulated)
+    engine.sync_system_prompt(st.session_state.messages)
+
+    # Display the recent chat messages on app rerun, older ones on demand
+    render_transcript(
+        st.session_state.messages,
+        load_older=(
+            (lambda: load_older_history(st.session_state, username))
+            if st.session_state.get(HAS_OLDER_KEY)
+            else None
+        ),
+    )
 
     # React to user input
     if prompt := st.chat_input(
@@ -101,25 +113,45 @@ def run_chatbot():
         # Display user message in chat message container
         st.chat_message("user").markdown(prompt)
 
-        # Add a system message to the chat history, but don't display it
-        st.session_state.messages.append(
-            {
-                "role": "system",
-                "content": f"You are a helpful assistant. Year now is {current_year}",
-            }
-        )
-
-        # Add user message to chat history
-        st.session_state.messages.append({"role": "user", "content": prompt})
-
-        # API Call
-        bot = ChatBot()
-        bot.history = st.session_state.messages.copy()  # Update history from messages
-        response = bot.generate_response(prompt)
+        # API Call: the engine sends a token-budgeted window of the history
+        history = list(st.session_state.messages)
 
-        # Display assistant response in chat message container
+        # Stream assistant response into the chat message container as it arrives
+        turn_metrics = {}
         with st.chat_message("assistant"):
-            st.markdown(response)
+            # Updated while the model is silent: each update is also a point
+            # where Streamlit can interrupt this run for a newer one
+            waiting = st.empty()
+
+            def show_waiting(seconds: float) -> None:
+                waiting.caption(f"⏳ Waiting for the model... {seconds:.0f}s")
+
+            try:
+                response = st.write_stream(
+                    engine.stream(
+                        history, prompt, st.session_state, turn_metrics, show_waiting
+                    )
+                )
+            except Exception as e:
+                # Retries are exhausted or the circuit breaker is open
+                waiting.empty()
+                st.error(f"Sorry, the model could not answer right now: {e}")
+                return
+            waiting.empty()
+            st.caption(
+                f"First token: {turn_metrics.get('time_to_first_token', 0.0):.2f}s · "
+                f"Total: {turn_metrics.get('total_latency', 0.0):.2f}s · "
+                f"System prompt tokens saved: {turn_metrics['system_tokens_saved']}"
+                + (" · Served from cache" if turn_metrics.get("cache_hit") else "")
+                + (
+                    f" · Similar prompt cached ({turn_metrics['semantic_similarity']:.2f})"
+                    if "semantic_similarity" in turn_metrics
+                    else ""
+                )
+            )
 
-        # Add assistant response to chat history
+        # Add the turn to chat history only once it has a reply, so a failed or
+        # interrupted stream leaves no unanswered prompt behind; then persist it
+        st.session_state.messages.append({"role": "user", "content": prompt})
         st.session_state.messages.append({"role": "assistant", "content": response})
+        save_turn(st.session_state, username)
@@ -0,0 +1,82 @@
+import os
+import threading
+from typing import TYPE_CHECKING, Dict, Optional, Tuple
+
+from dotenv import load_dotenv
+
+if TYPE_CHECKING:
+    # The SDK itself is imported lazily, on the first prompt (see _build_client)
+    from openai import OpenAI
+
+# Load environment variables from .env file (once per process, not per rerun)
+load_dotenv()
+
+# Connection pool settings, overridable from the environment
+POOL_SIZE = int(os.getenv("OPENAI_POOL_SIZE", "20"))
+POOL_KEEPALIVE = int(os.getenv("OPENAI_POOL_KEEPALIVE", str(POOL_SIZE)))
+KEEPALIVE_EXPIRY = float(os.getenv("OPENAI_KEEPALIVE_EXPIRY", "60"))
+CONNECT_TIMEOUT = float(os.getenv("OPENAI_CONNECT_TIMEOUT", "5"))
+REQUEST_TIMEOUT = float(os.getenv("OPENAI_TIMEOUT", "60"))
+
+_clients: Dict[Tuple[Optional[str], Optional[str]], "OpenAI"] = {}
+_clients_lock = threading.Lock()
+
+
+def _build_client(api_key: Optional[str], base_url: Optional[str]) -> "OpenAI":
+    """
+    Create an OpenAI client backed by a keep-alive HTTP connection pool.
+
+    Args:
+        api_key (Optional[str]): The API key for the client.
+        base_url (Optional[str]): Custom API base URL, or None for the default endpoint.
+
+    Returns:
+        OpenAI: A client whose HTTP connections are reused across requests.
+    """
+    # Imported here so pages only pay for the SDK once a prompt is sent
+    import httpx
+    from openai import OpenAI
+
+    http_client = httpx.Client(
+        limits=httpx.Limits(
+            max_connections=POOL_SIZE,
+            max_keepalive_connections=POOL_KEEPALIVE,
+            keepalive_expiry=KEEPALIVE_EXPIRY,
+        ),
+        timeout=httpx.Timeout(REQUEST_TIMEOUT, connect=CONNECT_TIMEOUT),
+    )
+    # Retries are handled by sections.resilience (backoff, Retry-After, breaker)
+    return OpenAI(
+        api_key=api_key, base_url=base_url, http_client=http_client, max_retries=0
+    )
+
+
+def get_openai_client(
+    api_key: Optional[str] = None, base_url: Optional[str] = None
+) -> "OpenAI":
+    """
+    Return the process-wide OpenAI client for an API key and base URL.
+
+    The client is created lazily on first use and then shared by every rerun
+    and every session, so repeated turns reuse warm TLS connections.
+
+    Args:
+        api_key (Optional[str]): The API key, defaults to `OPENAI_API_KEY`.
+        base_url (Optional[str]): The API base URL, defaults to `OPENAI_BASE_URL`.
+
+    Returns:
+        OpenAI: The shared client.
+    """
+    api_key = api_key or os.getenv("OPENAI_API_KEY")
+    base_url = base_url or os.getenv("OPENAI_BASE_URL")
+    key = (api_key, base_url)
+
+    client = _clients.get(key)
+    if client is None:
+        with _clients_lock:
+            # Another thread may have built it while we waited for the lock
+            client = _clients.get(key)
+            if client is None:
+                client = _build_client(api_key, base_url)
+                _clients[key] = client
+    return client
@@ -0,0 +1,175 @@
+"""
+Empirical Big-O estimates for the algorithm catalogue of sections/algorithms.py.
+
+Each algorithm is timed across its input sizes, and the timings are fitted in
+log space with NumPy least squares:
+
+- a power law, log t = a + k log n, whose slope k is reported;
+- scale-only models log t = a + log f(n) for O(1), O(log n), O(n),
+  O(n log n), O(n^2) and O(n^3);
+- an exponential, log t = a + b n, and a factorial, log t = a + k log n!.
+  These have a free rate, so they are only candidates once the power law
+  slope is beyond cubic (otherwise they would fit noise around O(1)).
+
+The class with the smallest residual wins. A stated complexity is flagged as
+a mismatch only when its own model fits clearly worse than the winner.
+
+Headless benchmark (exit code 1 if any stated complexity is contradicted):
+
+    python -m sections.complexity [name ...] [--repeats 3]
+"""
+
+import argparse
+import math
+import sys
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from sections.algorithms import CATALOGUE, time_sweep
+
+# A stated class is accepted while its residual is within this factor of the best
+MISMATCH_RATIO = 2.0
+# Absolute slack on residuals: over these sizes a log factor (O(n) vs
+# O(n log n)) is within timing noise, so it alone is not flagged
+_RESIDUAL_SLACK = 0.25
+# Power law slope above which super-polynomial classes are considered
+_SUPER_POLYNOMIAL_SLOPE = 3.0
+
+# Scale-only models: class -> log f(n)
+_POLYNOMIAL_MODELS = {
+    "O(1)": lambda n: np.zeros_like(n),
+    "O(log n)": lambda n: np.log(np.log(n)),
+    "O(n)": lambda n: np.log(n),
+    "O(n log n)": lambda n: np.log(n) + np.log(np.log(n)),
+    "O(n^2)": lambda n: 2 * np.log(n),
+    "O(n^3)": lambda n: 3 * np.log(n),
+}
+
+
+class Estimate(NamedTuple):
+    complexity: str  # The best fitting class, e.g. "O(n log n)"
+    slope: float  # Slope of the log-log power law fit
+    r_squared: float  # Of the log-log power law fit
+    residuals: Dict[str, float]  # Residual sum of squares per class
+    stated: Optional[str]  # The complexity the guide states, if any
+    matches: Optional[bool]  # None if nothing is stated
+
+
+def _linear_fit(x: np.ndarray, y: np.ndarray) -> Tuple[np.ndarray, float]:
+    # Least squares y = a + b x; returns the coefficients and the residual
+    design = np.column_stack([np.ones_like(x), x])
+    coefficients, _, _, _ = np.linalg.lstsq(design, y, rcond=None)
+    residual = float(np.sum((design @ coefficients - y) ** 2))
+    return coefficients, residual
+
+
+def estimate_complexity(
+    timings: Sequence[Tuple[int, float]], stated: Optional[str] = None
+) -> Estimate:
+    """
+    Classify the growth of measured runtimes.
+
+    Args:
+        timings (Sequence[Tuple[int, float]]): (n, seconds) pairs, n >= 2.
+        stated (Optional[str]): The claimed complexity, e.g. "O(n^2)".
+
+    Returns:
+        Estimate: The best fitting class, the power law fit and the verdict.
+    """
+    if len(timings) < 3:
+        raise ValueError("At least three input sizes are needed for a fit")
+    n = np.array([size for size, _ in timings], dtype=float)
+    log_t = np.log(np.array([seconds for _, seconds in timings], dtype=float))
+
+    (_, slope), power_residual = _linear_fit(np.log(n), log_t)
+    total = float(np.sum((log_t - log_t.mean()) ** 2))
+    r_squared = 1 - power_residual / total if total > 0 else 1.0
+
+    residuals = {}
+    for name, log_f in _POLYNOMIAL_MODELS.items():
+        # Only the scale is free: its least squares value is the mean offset
+        offset = log_t - log_f(n)
+        residuals[name] = float(np.sum((offset - offset.mean()) ** 2))
+    if slope > _SUPER_POLYNOMIAL_SLOPE:
+        _, residuals["O(2^n)"] = _linear_fit(n, log_t)
+        log_factorial = np.array([math.lgamma(size + 1) for size in n])
+        _, residuals["O(n!)"] = _linear_fit(log_factorial, log_t)
+
+    best = min(residuals, key=residuals.get)
+    matches = None
+    if stated is not None:
+        matches = stated == best or (
+            stated in residuals
+            and residuals[stated] <= MISMATCH_RATIO * residuals[best] + _RESIDUAL_SLACK
+        )
+    return Estimate(best, float(slope), r_squared, residuals, stated, matches)
+
+
+def check_algorithm(name: str, repeats: int = 3) -> Estimate:
+    """
+    Time a catalogued algorithm over its input sizes and estimate its class.
+
+    :param name: The algorithm's name in `CATALOGUE`.
+    :param repeats: Measurements per size.
+    :return: The estimate, checked against the guide's stated complexity.
+    """
+    timings = time_sweep(name, repeats=repeats)
+    return estimate_complexity(timings, CATALOGUE[name].notation)
+
+
+def check_catalogue(
+    names: Optional[List[str]] = None, repeats: int = 3
+) -> Dict[str, Estimate]:
+    """
+    Estimate the complexity of several catalogued algorithms.
+
+    :param names: Algorithm names, every catalogued one if None.
+    :param repeats: Measurements per size.
+    :return: The estimate per algorithm name.
+    """
+    return {name: check_algorithm(name, repeats) for name in names or CATALOGUE}
+
+
+def describe(estimate: Estimate) -> str:
+    """
+    Summarize an estimate in one line.
+
+    :param estimate: The estimate.
+    :return: E.g. "measured O(n^2), log-log slope 1.98: consistent with the
+        guide's O(n^2)".
+    """
+    summary = f"measured {estimate.complexity}, log-log slope {estimate.slope:.2f}"
+    if estimate.matches is None:
+        return summary
+    if estimate.matches:
+        return f"{summary}: consistent with the guide's {estimate.stated}"
+    return f"{summary}: contradicts the guide's {estimate.stated}"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(
+        description="Estimate the complexity of the guide's algorithms."
+    )
+    parser.add_argument("names", nargs="*", help="algorithms (default: all)")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    unknown = sorted(set(args.names) - set(CATALOGUE))
+    if unknown:
+        parser.error(f"unknown algorithms: {', '.join(unknown)}")
+
+    mismatches = 0
+    print(f"{'algorithm':<15} {'stated':<11} {'measured':<11} {'slope':>6} {'r2':>6}")
+    for name in args.names or CATALOGUE:
+        estimate = check_algorithm(name, args.repeats)
+        flag = {True: "ok", False: "MISMATCH", None: ""}[estimate.matches]
+        mismatches += estimate.matches is False
+        print(
+            f"{name:<15} {estimate.stated or '-':<11} {estimate.complexity:<11} "
+            f"{estimate.slope:>6.2f} {estimate.r_squared:>6.3f} {flag}"
+        )
+    sys.exit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+import os
+import time
+from typing import Callable, Iterator, List, MutableMapping, Optional
+
+from sections.cache import CompletionCache, make_cache_key
+from sections.clients import get_openai_client
+from sections.history import (
+    TOKEN_BUDGET,
+    count_message_tokens,
+    fit_history,
+    set_system_prompt,
+    system_tokens_saved,
+)
+from sections.pipeline import start_completion
+from sections.resilience import open_resilient_stream
+from sections.semantic_cache import SemanticCache
+
+# NOTE: feel free to change it to gpt-4, or gpt-4o
+DEFAULT_MODEL = os.getenv("OPENAI_MODEL", "gpt-3.5-turbo")
+
+
+class ChatEngine:
+    """
+    Chat completion engine shared by the chat pages.
+
+    A page describes what it wants (system prompt, model, which caches to use,
+    metric hooks); the engine owns how a turn is answered: token-budgeted
+    history, exact and semantic caching, retries, and cancellable streaming.
+    """
+
+    def __init__(
+        self,
+        system_prompt: str,
+        model: str = DEFAULT_MODEL,
+        cache: Optional[CompletionCache] = None,
+        semantic_cache: Optional[SemanticCache] = None,
+        hooks: Optional[List[Callable[[dict], None]]] = None,
+    ):
+        """
+        Configure an engine for one page.
+
+        Args:
+            system_prompt (str): The system prompt of the conversation.
+            model (str): The chat model to call.
+            cache (Optional[CompletionCache]): Cache for identical requests.
+            semantic_cache (Optional[SemanticCache]): Cache for paraphrased prompts.
+            hooks (Optional[List[Callable[[dict], None]]]): Called with the
+                metrics of every completed turn.
+        """
+        self.system_prompt = system_prompt
+        self.model = model
+        self.cache = cache
+        self.semantic_cache = semantic_cache
+        self.hooks = hooks or []
+
+    @property
+    def client(self):
+        return get_openai_client()  # Shared, pooled client
+
+    def sync_system_prompt(self, history: List[dict]) -> int:
+        """
+        Make the engine's system prompt the one system message of `history`.
+
+        :param history: The conversation history, modified in place.
+        :return: The number of tokens removed by collapsing duplicates.
+        """
+        return set_system_prompt(history, self.system_prompt)
+
+    def build_messages(self, history: List[dict], prompt: str) -> List[dict]:
+        """
+        Build the request: a token-budgeted window of `history` plus the prompt.
+
+        Args:
+            history (List[dict]): The conversation so far, without the prompt.
+            prompt (str): The new user prompt.
+
+        Returns:
+            List[dict]: The messages to send.
+        """
+        user_message = {"role": "user", "content": prompt}
+        window = fit_history(
+            history, budget=TOKEN_BUDGET - count_message_tokens(user_message)
+        )
+        # Plain dicts for the API payload (the session keeps compact records)
+        return [{"role": m["role"], "content": m["content"]} for m in window] + [
+            user_message
+        ]
+
+    def _lookup_cache(self, messages: List[dict], prompt: str, metrics: dict):
+        # Identical request first, then a paraphrase asked in the same context
+        if self.cache is not None:
+            response = self.cache.get(make_cache_key(self.model, messages))
+            if response is not None:
+                metrics["cache_hit"] = True
+                return response
+        if self.semantic_cache is not None:
+            namespace = make_cache_key(self.model, messages[:-1])
+            match = self.semantic_cache.lookup(namespace, prompt)
+            if match is not None:
+                response, metrics["semantic_similarity"] = match
+                return response
+        return None
+
+    def _store_cache(self, messages: List[dict], prompt: str, response: str) -> None:
+        if self.cache is not None:
+            self.cache.put(make_cache_key(self.model, messages), response)
+        if self.semantic_cache is not None:
+            namespace = make_cache_key(self.model, messages[:-1])
+            self.semantic_cache.add(namespace, prompt, response)
+
+    def _finish(self, metrics: dict) -> None:
+        for hook in self.hooks:
+            hook(metrics)
+
+    def stream(
+        self,
+        history: List[dict],
+        prompt: str,
+        state: MutableMapping,
+        metrics: Optional[dict] = None,
+        on_wait: Optional[Callable[[float], None]] = None,
+    ) -> Iterator[str]:
+        """
+        Stream the answer to a prompt as text deltas.
+
+        The completion runs on a worker thread registered in the session's
+        state. A rerun (a new prompt, a cleared session) cancels it once the
+        script run is interrupted: at the next delta, or at the next `on_wait`
+        call while no delta arrives.
+
+        Args:
+            history (List[dict]): The conversation so far, without the prompt.
+            prompt (str): The new user prompt.
+            state (MutableMapping): The session state of the requesting user.
+            metrics (Optional[dict]): Filled in place with `time_to_first_token`,
+                `total_latency`, `system_tokens_saved` and cache information.
+            on_wait (Optional[Callable[[float], None]]): Called with the
+                seconds waited so far while no delta arrives, e.g. to update a
+                Streamlit element (see `CompletionTask.deltas`).
+
+        Yields:
+            str: Content deltas in the order they arrive.
+        """
+        metrics = {} if metrics is None else metrics
+        messages = self.build_messages(history, prompt)
+        metrics["system_tokens_saved"] = system_tokens_saved(messages)
+        started = time.perf_counter()
+
+        response = self._lookup_cache(messages, prompt, metrics)
+        if response is not None:
+            metrics["time_to_first_token"] = time.perf_counter() - started
+            metrics["total_latency"] = metrics["time_to_first_token"]
+            self._finish(metrics)
+            yield response
+            return
+
+        task = start_completion(
+            state,
+            lambda: open_resilient_stream(
+                lambda: self.client.chat.completions.create(
+                    model=self.model,
+                    messages=messages,
+                    stream=True,
+                )
+            ),
+        )
+
+        chunks = []
+        for delta in task.deltas(on_wait):
+            if "time_to_first_token" not in metrics:
+                metrics["time_to_first_token"] = time.perf_counter() - started
+            chunks.append(delta)
+            yield delta
+        metrics["total_latency"] = time.perf_counter() - started
+
+        self._store_cache(messages, prompt, "".join(chunks))
+        self._finish(metrics)
@@ -0,0 +1,274 @@
+"""
+Production versions of the guide's teaching algorithms.
+
+The teaching versions in sections/algorithms.py favour clarity and allocate
+heavily (list slicing, comprehensions, recursion without memory). The
+versions below compute the same results with fewer allocations or in C:
+
+- memoized and iterative Fibonacci instead of exponential recursion;
+- `itertools.permutations` instead of rebuilding lists at every level;
+- an index-based merge sort with a single scratch buffer, on runs built by
+  binary insertion;
+- an in-place quick sort with an explicit stack;
+- NumPy radix and counting sorts;
+- a bottom-up coin change table in an `array`.
+
+`compare_variants` times each pair on the same inputs, measures the peak
+memory of one call of each with `tracemalloc`, and checks that the results
+agree.
+"""
+
+import itertools
+import random
+import tracemalloc
+from array import array
+from bisect import insort
+from typing import Callable, List, NamedTuple, Optional, Sequence, Tuple
+
+import numpy as np
+
+from sections.algorithms import CATALOGUE, measure
+
+
+def fibonacci_memo(n, memo=None):
+    # Each value is computed once: O(n) instead of O(2^n)
+    if memo is None:
+        memo = {}
+    if n <= 1:
+        return n
+    if n not in memo:
+        memo[n] = fibonacci_memo(n - 1, memo) + fibonacci_memo(n - 2, memo)
+    return memo[n]
+
+
+def fibonacci_iterative(n):
+    # O(n) time, O(1) space and no recursion limit
+    previous, current = 0, 1
+    for _ in range(n):
+        previous, current = current, previous + current
+    return previous
+
+
+def permutations_itertools(lst):
+    # Generated in C; only the output lists are allocated
+    return [list(p) for p in itertools.permutations(lst)]
+
+
+# Runs shorter than this are sorted by binary insertion before merging
+_MERGE_SORT_RUN = 32
+
+
+def merge_sort_indexed(arr):
+    # Bottom-up merge sort on index ranges, alternating between the list and
+    # one scratch buffer instead of slicing new lists at every level. Short
+    # runs are built first with insort (bisect and insert both run in C),
+    # which saves the five merge passes the interpreter is slowest at
+    n = len(arr)
+    for lo in range(0, n, _MERGE_SORT_RUN):
+        run = []
+        for value in arr[lo : lo + _MERGE_SORT_RUN]:
+            insort(run, value)
+        arr[lo : lo + _MERGE_SORT_RUN] = run
+
+    passes, width = 0, _MERGE_SORT_RUN
+    while width < n:
+        passes += 1
+        width *= 2
+    # Each pass writes into the other buffer: start from the scratch copy when
+    # the number of passes is odd, so the last one lands in `arr`
+    scratch = arr[:]
+    source, target = (arr, scratch) if passes % 2 == 0 else (scratch, arr)
+    width = _MERGE_SORT_RUN
+    while width < n:
+        for lo in range(0, n, 2 * width):
+            mid = min(lo + width, n)
+            hi = min(lo + 2 * width, n)
+            i, j, k = lo, mid, lo
+            while i < mid and j < hi:
+                if source[j] < source[i]:
+                    target[k] = source[j]
+                    j += 1
+                else:
+                    target[k] = source[i]
+                    i += 1
+                k += 1
+            # One of the runs is exhausted: copy the rest of the other in C
+            target[k : k + mid - i] = source[i:mid]
+            k += mid - i
+            target[k:hi] = source[j:hi]
+        source, target = target, source
+        width *= 2
+    return arr
+
+
+def quick_sort_inplace(arr):
+    # Hoare partitioning around the middle element, with an explicit stack of
+    # ranges instead of recursion and new lists
+    stack = [(0, len(arr) - 1)]
+    while stack:
+        lo, hi = stack.pop()
+        if lo >= hi:
+            continue
+        pivot = arr[(lo + hi) // 2]
+        i, j = lo, hi
+        while i <= j:
+            while arr[i] < pivot:
+                i += 1
+            while arr[j] > pivot:
+                j -= 1
+            if i <= j:
+                arr[i], arr[j] = arr[j], arr[i]
+                i += 1
+                j -= 1
+        stack.append((lo, j))
+        stack.append((i, hi))
+    return arr
+
+
+def radix_sort_numpy(arr):
+    # LSD radix sort with one vectorized stable pass per decimal digit
+    values = np.asarray(arr, dtype=np.int64)
+    if values.size == 0:
+        return []
+    position = 1
+    while values.max() // position > 0:
+        digits = values // position % 10
+        values = values[np.argsort(digits, kind="stable")]
+        position *= 10
+    return values.tolist()
+
+
+def counting_sort_numpy(arr):
+    # For small non-negative integer keys: count each key, then expand
+    values = np.asarray(arr, dtype=np.int64)
+    counts = np.bincount(values)
+    return np.repeat(np.arange(counts.size), counts).tolist()
+
+
+def coin_change_dp(coins, amount):
+    # Bottom-up table of the fewest coins per amount, in a typed array: optimal
+    # for any coin system, where the greedy version only is for canonical ones
+    unreachable = amount + 1
+    fewest = array("l", [unreachable]) * (amount + 1)
+    fewest[0] = 0
+    for coin in coins:
+        for value in range(coin, amount + 1):
+            candidate = fewest[value - coin] + 1
+            if candidate < fewest[value]:
+                fewest[value] = candidate
+    return fewest[amount] if fewest[amount] != unreachable else -1
+
+
+def canonical_coins_and_amount(n: int, rng: random.Random) -> Tuple[list, int]:
+    # A canonical coin system, where greedy and DP agree; n is the amount
+    return [1, 2, 5, 10, 20, 50, 100, 200], n
+
+
+class Variant(NamedTuple):
+    teaching: str  # Name of the teaching version in CATALOGUE
+    function: Callable
+    n: int  # Input size of the comparison
+    mutates: bool = False
+    # Inputs for the comparison, the teaching version's generator if None
+    make_args: Optional[Callable[[int, random.Random], tuple]] = None
+    note: str = ""
+
+
+VARIANTS: List[Variant] = [
+    Variant("fibonacci", fibonacci_memo, 24),
+    Variant("fibonacci", fibonacci_iterative, 24),
+    Variant("permutations", permutations_itertools, 8),
+    Variant("merge_sort", merge_sort_indexed, 64000, mutates=True),
+    Variant("quick_sort", quick_sort_inplace, 64000, mutates=True),
+    Variant("radix_sort", radix_sort_numpy, 64000),
+    Variant(
+        "radix_sort",
+        counting_sort_numpy,
+        64000,
+        note="one counter per possible key: for small key ranges only",
+    ),
+    Variant(
+        "coin_change",
+        coin_change_dp,
+        20000,
+        make_args=canonical_coins_and_amount,
+        note="slower, but optimal for any coin system",
+    ),
+]
+
+
+def _copy_args(args: tuple) -> list:
+    # Each call gets its own lists, as sorts may work in place
+    return [list(arg) if isinstance(arg, list) else arg for arg in args]
+
+
+def _peak_allocation(function: Callable, args: tuple) -> Tuple[object, int]:
+    # The result of one call and the peak bytes it allocated on top of its input
+    args = _copy_args(args)
+    tracemalloc.start()
+    try:
+        result = function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, peak
+
+
+def variants_for(names: Sequence[str]) -> List[Variant]:
+    """
+    List the production variants of some teaching algorithms.
+
+    :param names: Names of teaching algorithms in `CATALOGUE`.
+    :return: Their variants, in `VARIANTS` order.
+    """
+    return [variant for variant in VARIANTS if variant.teaching in names]
+
+
+def compare_variants(
+    names: Optional[Sequence[str]] = None, repeats: int = 3
+) -> List[dict]:
+    """
+    Time teaching and production versions on the same inputs.
+
+    Args:
+        names (Optional[Sequence[str]]): Teaching algorithms to compare, all
+            that have variants if None.
+        repeats (int): Measurements per version.
+
+    Returns:
+        List[dict]: One row per variant: both timings in milliseconds, the
+        speedup, the peak memory each call allocated, and whether both
+        versions returned the same result.
+    """
+    rows = []
+    for variant in VARIANTS if names is None else variants_for(names):
+        teaching = CATALOGUE[variant.teaching]
+        if variant.make_args is not None:
+            teaching = teaching._replace(make_args=variant.make_args)
+        production = teaching._replace(
+            name=variant.function.__name__,
+            function=variant.function,
+            mutates=variant.mutates,
+        )
+
+        args = teaching.make_args(variant.n, random.Random(0))
+        expected, teaching_peak = _peak_allocation(teaching.function, args)
+        actual, production_peak = _peak_allocation(production.function, args)
+
+        teaching_seconds = measure(teaching, variant.n, repeats)
+        production_seconds = measure(production, variant.n, repeats)
+        rows.append(
+            {
+                "teaching": teaching.name,
+                "production": production.name,
+                "n": variant.n,
+                "teaching ms": round(teaching_seconds * 1000, 3),
+                "production ms": round(production_seconds * 1000, 3),
+                "speedup": round(teaching_seconds / production_seconds, 1),
+                "teaching peak KB": teaching_peak // 1024,
+                "production peak KB": production_peak // 1024,
+                "same result": expected == actual,
+                "note": variant.note,
+            }
+        )
+    return rows
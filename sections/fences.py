@@ -0,0 +1,152 @@
+import io
+import zipfile
+from typing import Iterable, Iterator, List, NamedTuple, Optional
+
+# File extension per fence language tag, "txt" for anything else
+EXTENSIONS = {
+    "python": "py",
+    "py": "py",
+    "javascript": "js",
+    "js": "js",
+    "typescript": "ts",
+    "ts": "ts",
+    "bash": "sh",
+    "sh": "sh",
+    "shell": "sh",
+    "sql": "sql",
+    "json": "json",
+    "yaml": "yml",
+    "yml": "yml",
+    "html": "html",
+    "css": "css",
+    "java": "java",
+    "c": "c",
+    "cpp": "cpp",
+    "c++": "cpp",
+    "go": "go",
+    "rust": "rs",
+    "r": "r",
+    "dockerfile": "dockerfile",
+    "markdown": "md",
+}
+
+
+class CodeBlock(NamedTuple):
+    language: str  # Lowercased first word of the info string, "" if none
+    code: str
+
+
+class FenceParser:
+    """
+    Incremental parser of fenced code blocks (``` or ~~~) in markdown text.
+
+    Text is fed in arbitrary chunks, e.g. streamed tokens. Each character is
+    looked at once: only the current partial line is buffered, and a block is
+    returned as soon as its closing fence arrives.
+    """
+
+    def __init__(self):
+        self._partial = ""
+        self._fence: Optional[str] = None  # The opening fence, while inside a block
+        self._language = ""
+        self._lines: List[str] = []
+
+    def feed(self, text: str) -> List[CodeBlock]:
+        """
+        Parse the next chunk of text.
+
+        :param text: The chunk, which may end mid-line.
+        :return: The blocks closed by this chunk.
+        """
+        blocks = []
+        lines = (self._partial + text).split("\n")
+        self._partial = lines.pop()
+        for line in lines:
+            block = self._line(line)
+            if block is not None:
+                blocks.append(block)
+        return blocks
+
+    def close(self) -> List[CodeBlock]:
+        """
+        Finish parsing; a block left open at the end of the text is returned too.
+
+        :return: The blocks completed by the end of the text.
+        """
+        blocks = []
+        if self._partial:
+            block = self._line(self._partial)
+            self._partial = ""
+            if block is not None:
+                blocks.append(block)
+        if self._fence is not None:
+            blocks.append(CodeBlock(self._language, "\n".join(self._lines)))
+            self._fence = None
+        return blocks
+
+    def _line(self, line: str) -> Optional[CodeBlock]:
+        stripped = line.strip()
+        if self._fence is None:
+            # Opening fence: up to 3 spaces of indent, then 3+ backticks or tildes
+            if len(line) - len(line.lstrip(" ")) <= 3 and stripped[:3] in ("```", "~~~"):
+                marker = stripped[0]
+                length = len(stripped) - len(stripped.lstrip(marker))
+                info = stripped[length:].strip()
+                if marker == "`" and "`" in info:
+                    return None  # Inline code such as ```x```, not a fence
+                self._fence = marker * length
+                self._language = info.split(maxsplit=1)[0].lower() if info else ""
+                self._lines = []
+            return None
+
+        # Closing fence: the same character, at least as long, nothing after it
+        if stripped.startswith(self._fence) and stripped == stripped[0] * len(stripped):
+            block = CodeBlock(self._language, "\n".join(self._lines))
+            self._fence = None
+            self._lines = []
+            return block
+        self._lines.append(line)
+        return None
+
+
+def iter_code_blocks(chunks: Iterable[str]) -> Iterator[CodeBlock]:
+    """
+    Yield every fenced code block of a chunked text as soon as it is complete.
+
+    :param chunks: The text in pieces, e.g. streamed response deltas.
+    :return: An iterator of the code blocks in order.
+    """
+    parser = FenceParser()
+    for chunk in chunks:
+        yield from parser.feed(chunk)
+    yield from parser.close()
+
+
+def file_extension(language: str) -> str:
+    """
+    Map a fence language tag to a file extension.
+
+    :param language: The language tag, e.g. "python".
+    :return: The extension without a dot, "txt" for unknown languages.
+    """
+    return EXTENSIONS.get(language, "txt")
+
+
+def bundle_code_blocks(blocks: List[CodeBlock], stem: str) -> io.BytesIO:
+    """
+    Pack code blocks into an in-memory zip, one file per block.
+
+    Args:
+        blocks (List[CodeBlock]): The code blocks, in order.
+        stem (str): The file name prefix, e.g. "2024_05_01_abc".
+
+    Returns:
+        io.BytesIO: The zip archive, rewound to its start.
+    """
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as archive:
+        for index, block in enumerate(blocks, start=1):
+            name = f"{stem}_{index:02d}.{file_extension(block.language)}"
+            archive.writestr(name, block.code + "\n")
+    buffer.seek(0)
+    return buffer
@@ -0,0 +1,115 @@
+import re
+from functools import lru_cache
+from typing import Dict, List, Optional
+
+from sections.guide_content import GUIDE_MARKDOWN
+
+_HEADING = re.compile(r"^(#{1,3})\s+(.*?)\s*#*\s*$")
+
+
+class Section:
+    """One `##` or `###` section of the guide (or the introduction before them)."""
+
+    __slots__ = ("key", "title", "level", "body", "parent", "children")
+
+    def __init__(self, key: str, title: str, level: int, parent: Optional["Section"]):
+        self.key = key
+        self.title = title
+        self.level = level
+        self.body = ""
+        self.parent = parent
+        self.children: List["Section"] = []
+
+    @property
+    def label(self) -> str:
+        """The title as plain text, for widgets that do not render markdown."""
+        return plain_title(self.title)
+
+    def markdown(self) -> str:
+        """The section's heading and own content, without its subsections."""
+        return f"{'#' * self.level} {self.title}\n\n{self.body}"
+
+
+class Guide:
+    """The guide split into a tree of sections, in document order."""
+
+    def __init__(self, sections: List[Section]):
+        self.sections = sections
+        self.by_key: Dict[str, Section] = {section.key: section for section in sections}
+
+
+def plain_title(title: str) -> str:
+    """
+    Strip LaTeX and emphasis from a heading, e.g. "Big $\\mathcal{O}$" -> "Big O".
+
+    :param title: The markdown heading text.
+    :return: The heading as plain text.
+    """
+    title = title.replace("\\mathcal{O}", "O").replace("$", "").replace("**", "")
+    return re.sub(r"\\(\w+)", r"\1", title).strip()
+
+
+def _slug(title: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", plain_title(title).lower()).strip("-")
+
+
+def parse_guide(markdown: str) -> Guide:
+    """
+    Split markdown into sections at its `#`, `##` and `###` headings.
+
+    Headings inside fenced code blocks (e.g. Python comments) are not headings.
+    `####` and deeper headings stay in the body of their section.
+
+    :param markdown: The guide text.
+    :return: The parsed guide.
+    """
+    sections: List[Section] = []
+    current = Section("introduction", "Introduction", 1, None)
+    sections.append(current)
+    top: Optional[Section] = None
+    lines: List[str] = []
+    fence: Optional[str] = None
+
+    def close_section() -> None:
+        current.body = "\n".join(lines).strip("\n")
+
+    for line in markdown.split("\n"):
+        stripped = line.strip()
+        if fence is None and stripped[:3] in ("```", "~~~"):
+            fence = stripped[:3]
+        elif fence is not None and stripped.startswith(fence) and not stripped.strip(fence[0]):
+            fence = None
+        elif fence is None:
+            match = _HEADING.match(stripped)
+            if match:
+                level, title = len(match.group(1)), match.group(2)
+                if level == 1:
+                    # The document title names the introduction
+                    current.title = title
+                    continue
+                close_section()
+                parent = top if level == 3 and top is not None else None
+                key = _slug(title) if parent is None else f"{parent.key}/{_slug(title)}"
+                while key in {section.key for section in sections}:
+                    key += "-"
+                current = Section(key, title, level, parent)
+                if parent is None:
+                    top = current
+                else:
+                    parent.children.append(current)
+                sections.append(current)
+                lines = []
+                continue
+        lines.append(line)
+    close_section()
+    return Guide(sections)
+
+
+@lru_cache(maxsize=None)
+def get_guide() -> Guide:
+    """
+    Return the Software Engineer Basics guide, parsed once per process.
+
+    :return: The shared parsed guide.
+    """
+    return parse_guide(GUIDE_MARKDOWN)
@@ -0,0 +1,109 @@
+import math
+import re
+from collections import Counter, defaultdict
+from functools import lru_cache
+from typing import Dict, List, NamedTuple, Tuple
+
+from sections.guide import Guide, Section, get_guide
+
+# BM25 parameters: term frequency saturation and length normalization
+BM25_K1 = 1.5
+BM25_B = 0.75
+# Headings count as this many occurrences of their terms
+TITLE_WEIGHT = 3
+
+_WORD = re.compile(r"[a-z0-9_]+")
+
+
+class SearchResult(NamedTuple):
+    section: Section
+    score: float
+    snippet: str
+
+
+def _normalize(word: str) -> str:
+    # Crude plural folding, so "sorts" finds "sort"
+    if len(word) > 3 and word.endswith("s") and not word.endswith("ss"):
+        return word[:-1]
+    return word
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercased search terms.
+
+    Identifiers are indexed whole and by their parts, so `coin_change` matches
+    "coin change" as well as "coin_change".
+
+    :param text: Prose, markdown or code.
+    :return: The terms, in order.
+    """
+    terms = []
+    for word in _WORD.findall(text.lower()):
+        parts = [part for part in word.split("_") if part]
+        if len(parts) > 1:
+            terms.append(word)
+        terms.extend(_normalize(part) for part in parts)
+    return terms
+
+
+class GuideIndex:
+    """An inverted index with BM25 ranking over the sections of a guide."""
+
+    def __init__(self, guide: Guide):
+        self.sections = guide.sections
+        # term -> [(section index, term frequency)]
+        self.postings: Dict[str, List[Tuple[int, int]]] = defaultdict(list)
+        self.lengths: List[int] = []
+        for index, section in enumerate(self.sections):
+            terms = tokenize(section.title) * TITLE_WEIGHT + tokenize(section.body)
+            self.lengths.append(len(terms))
+            for term, count in Counter(terms).items():
+                self.postings[term].append((index, count))
+        self.average_length = sum(self.lengths) / max(len(self.lengths), 1)
+
+    def _idf(self, term: str) -> float:
+        matches = len(self.postings.get(term, ()))
+        return math.log(1 + (len(self.sections) - matches + 0.5) / (matches + 0.5))
+
+    def search(self, query: str, limit: int = 5) -> List[SearchResult]:
+        """
+        Rank the sections matching a query.
+
+        Args:
+            query (str): Free text, e.g. "radix sort".
+            limit (int): The maximum number of results.
+
+        Returns:
+            List[SearchResult]: The best sections first, with a matching line.
+        """
+        terms = set(tokenize(query))
+        scores: Dict[int, float] = defaultdict(float)
+        for term in terms:
+            idf = self._idf(term)
+            for index, count in self.postings.get(term, ()):
+                norm = 1 - BM25_B + BM25_B * self.lengths[index] / self.average_length
+                scores[index] += idf * count * (BM25_K1 + 1) / (count + BM25_K1 * norm)
+
+        ranked = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+        return [
+            SearchResult(self.sections[index], score, self._snippet(index, terms))
+            for index, score in ranked[:limit]
+        ]
+
+    def _snippet(self, index: int, terms: set) -> str:
+        # The first line of the section that contains a query term
+        for line in self.sections[index].body.split("\n"):
+            if terms & set(tokenize(line)):
+                return line.strip()
+        return ""
+
+
+@lru_cache(maxsize=None)
+def get_guide_index() -> GuideIndex:
+    """
+    Return the search index of the guide, built once per process.
+
+    :return: The shared index.
+    """
+    return GuideIndex(get_guide())
@@ -0,0 +1,140 @@
+import os
+from functools import lru_cache
+from typing import Callable, List, Optional
+
+# Maximum number of prompt tokens sent to the model per request
+TOKEN_BUDGET = int(os.getenv("CHAT_TOKEN_BUDGET", "3000"))
+
+# Tokens the chat format adds around every message (role, separators)
+MESSAGE_OVERHEAD = 4
+
+
+@lru_cache(maxsize=1)
+def _get_encoder() -> Optional[Callable[[str], list]]:
+    """
+    Load the tiktoken encoder once, if tiktoken is installed.
+
+    :return: The encoding function, or None to fall back to a character estimate.
+    """
+    try:
+        import tiktoken
+    except ImportError:
+        return None
+    return tiktoken.get_encoding("cl100k_base").encode
+
+
+@lru_cache(maxsize=8192)
+def count_text_tokens(text: str) -> int:
+    """
+    Count the tokens in a piece of text.
+
+    Results are memoized, so a message already in the history is only
+    tokenized once no matter how many turns it is sent with.
+
+    :param text: The text to count.
+    :return: The number of tokens (about 4 characters per token without tiktoken).
+    """
+    encode = _get_encoder()
+    if encode is None:
+        return (len(text) + 3) // 4
+    return len(encode(text))
+
+
+def count_message_tokens(message: dict) -> int:
+    """
+    Count the tokens a single chat message costs in a request.
+
+    :param message: A chat message with `role` and `content`.
+    :return: The number of tokens including per-message overhead.
+    """
+    return (
+        MESSAGE_OVERHEAD
+        + count_text_tokens(message["role"])
+        + count_text_tokens(message["content"])
+    )
+
+
+def fit_history(
+    messages: List[dict],
+    budget: int = TOKEN_BUDGET,
+    summarize: Optional[Callable[[List[dict]], str]] = None,
+) -> List[dict]:
+    """
+    Select the messages to send so the request stays within a token budget.
+
+    System messages are always kept. The remaining turns are kept newest first
+    until the budget is spent; the most recent turn is kept even if it alone
+    exceeds the budget. Dropped turns are either discarded or, if `summarize`
+    is given, replaced with a single system message holding their summary.
+
+    Args:
+        messages (List[dict]): The full conversation history.
+        budget (int): The maximum number of tokens to send.
+        summarize (Optional[Callable[[List[dict]], str]]): Optional function that
+            condenses the dropped turns into a short text.
+
+    Returns:
+        List[dict]: The messages to send, in their original order.
+    """
+    system = [m for m in messages if m["role"] == "system"]
+    turns = [m for m in messages if m["role"] != "system"]
+
+    remaining = budget - sum(count_message_tokens(m) for m in system)
+    kept = []
+    for message in reversed(turns):
+        cost = count_message_tokens(message)
+        if cost > remaining and kept:
+            break
+        kept.append(message)
+        remaining -= cost
+    kept.reverse()
+
+    dropped = turns[: len(turns) - len(kept)]
+    if dropped and summarize is not None:
+        summary = {
+            "role": "system",
+            "content": f"Summary of the earlier conversation: {summarize(dropped)}",
+        }
+        return system + [summary] + kept
+    return system + kept
+
+
+def set_system_prompt(messages: List[dict], content: str) -> int:
+    """
+    Make `content` the one system prompt of a conversation, in place.
+
+    Older sessions carry one system message per turn; these are collapsed into a
+    single system message at the start of the history.
+
+    Args:
+        messages (List[dict]): The conversation history, modified in place.
+        content (str): The system prompt text.
+
+    Returns:
+        int: The number of tokens removed by collapsing duplicate system messages.
+    """
+    if messages and messages[0]["role"] == "system":
+        if not any(m["role"] == "system" for m in messages[1:]):
+            # Already canonical: just refresh the text
+            messages[0]["content"] = content
+            return 0
+
+    duplicates = [m for m in messages if m["role"] == "system"][1:]
+    messages[:] = [{"role": "system", "content": content}] + [
+        m for m in messages if m["role"] != "system"
+    ]
+    return sum(count_message_tokens(m) for m in duplicates)
+
+
+def system_tokens_saved(messages: List[dict]) -> int:
+    """
+    Estimate the tokens saved by sending one system prompt instead of one per turn.
+
+    :param messages: The messages sent with the request, including the new prompt.
+    :return: The tokens the repeated system messages would have cost.
+    """
+    system = [m for m in messages if m["role"] == "system"]
+    if not system:
+        return 0
+    user_turns = sum(1 for m in messages if m["role"] == "user")
+    return max(user_turns - 1, 0) * count_message_tokens(system[0])
@@ -0,0 +1,306 @@
+import hashlib
+import hmac
+import os
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from typing import Optional
+
+import bcrypt
+import streamlit as st
+
+from sections.auth import get_config
+from sections.user_store import get_credential_backend
+
+# Password verification pool: bcrypt releases the GIL, so checks running here
+# do not stall the script threads of other sessions
+LOGIN_WORKERS = int(os.getenv("LOGIN_WORKERS", "2"))
+LOGIN_MAX_PENDING = int(os.getenv("LOGIN_MAX_PENDING", "16"))
+LOGIN_VERIFY_TIMEOUT = float(os.getenv("LOGIN_VERIFY_TIMEOUT", "10"))
+
+# Failed attempts allowed per window, per username and per client IP
+LOGIN_USER_ATTEMPTS = int(os.getenv("LOGIN_USER_ATTEMPTS", "5"))
+LOGIN_IP_ATTEMPTS = int(os.getenv("LOGIN_IP_ATTEMPTS", "20"))
+LOGIN_WINDOW_SECONDS = float(os.getenv("LOGIN_WINDOW_SECONDS", "300"))
+# Reverse proxies in front of the app that append to X-Forwarded-For (Azure's
+# front end is one); the client address is the hop the outermost one added
+LOGIN_TRUSTED_PROXIES = int(os.getenv("LOGIN_TRUSTED_PROXIES", "1"))
+
+# Upper bound on remembered keys, so a stuffing attack cannot grow memory forever
+_MAX_TRACKED_KEYS = 10000
+
+
+class LoginRateLimitedError(RuntimeError):
+    """Raised when a username or client has too many recent failed logins."""
+
+
+class LoginBusyError(RuntimeError):
+    """Raised when too many password checks are already queued."""
+
+
+class RateLimiter:
+    """
+    Sliding-window limit on failed attempts per key.
+
+    At most `_MAX_TRACKED_KEYS` keys are remembered: expired keys are dropped
+    first, then the least recently failing ones.
+    """
+
+    def __init__(self, max_failures: int, window_seconds: float):
+        self.max_failures = max_failures
+        self.window_seconds = window_seconds
+        self._failures: "OrderedDict[str, deque]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def retry_after(self, key: str) -> float:
+        """
+        Return how long `key` must wait before its next attempt.
+
+        :param key: A username or client address.
+        :return: Seconds to wait, 0 if an attempt is allowed now.
+        """
+        now = time.monotonic()
+        with self._lock:
+            failures = self._failures.get(key)
+            if not failures:
+                return 0.0
+            while failures and now - failures[0] > self.window_seconds:
+                failures.popleft()
+            if len(failures) < self.max_failures:
+                return 0.0
+            return self.window_seconds - (now - failures[0])
+
+    def record_failure(self, key: str) -> None:
+        with self._lock:
+            if key not in self._failures and len(self._failures) >= _MAX_TRACKED_KEYS:
+                self._prune()
+                while len(self._failures) >= _MAX_TRACKED_KEYS:
+                    self._failures.popitem(last=False)
+            self._failures.setdefault(key, deque()).append(time.monotonic())
+            self._failures.move_to_end(key)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._failures.pop(key, None)
+
+    def _prune(self) -> None:
+        # Caller holds the lock: drop keys whose failures are all outside the window
+        now = time.monotonic()
+        for key in [
+            key
+            for key, failures in self._failures.items()
+            if not failures or now - failures[-1] > self.window_seconds
+        ]:
+            del self._failures[key]
+
+
+class VerifiedLogins:
+    """
+    Remembers successful password checks so they need not be repeated.
+
+    Entries are keyed by an HMAC of username and password under a per-process
+    random key, so neither is kept in memory. An entry is only valid for the
+    password hash it was checked against, so a password change invalidates it.
+    """
+
+    def __init__(self):
+        self._key = os.urandom(32)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _digest(self, username: str, password: str) -> str:
+        message = f"{username}\0{password}".encode("utf-8")
+        return hmac.new(self._key, message, hashlib.sha256).hexdigest()
+
+    def check(self, username: str, password: str, password_hash: str) -> bool:
+        digest = self._digest(username, password)
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry is None:
+                return False
+            expires_at, verified_hash = entry
+            if time.time() > expires_at or verified_hash != password_hash:
+                del self._entries[digest]
+                return False
+            self._entries.move_to_end(digest)
+            return True
+
+    def remember(
+        self, username: str, password: str, password_hash: str, ttl: float
+    ) -> None:
+        digest = self._digest(username, password)
+        with self._lock:
+            self._entries[digest] = (time.time() + ttl, password_hash)
+            self._entries.move_to_end(digest)
+            while len(self._entries) > _MAX_TRACKED_KEYS:
+                self._entries.popitem(last=False)
+
+
+_executor = ThreadPoolExecutor(max_workers=LOGIN_WORKERS, thread_name_prefix="bcrypt")
+_pending = threading.BoundedSemaphore(LOGIN_MAX_PENDING)
+_user_limiter = RateLimiter(LOGIN_USER_ATTEMPTS, LOGIN_WINDOW_SECONDS)
+_ip_limiter = RateLimiter(LOGIN_IP_ATTEMPTS, LOGIN_WINDOW_SECONDS)
+_verified = VerifiedLogins()
+_dummy_hash: Optional[bytes] = None
+
+
+def _check_in_pool(password: str, password_hash: bytes) -> bool:
+    if not _pending.acquire(blocking=False):
+        raise LoginBusyError("Too many logins in progress, please try again shortly")
+    try:
+        future = _executor.submit(bcrypt.checkpw, password.encode(), password_hash)
+    except BaseException:
+        _pending.release()
+        raise
+    # The slot is held until the check has run or been cancelled, not just
+    # until this caller stops waiting, so the pending bound covers the work
+    future.add_done_callback(lambda _: _pending.release())
+    try:
+        return future.result(timeout=LOGIN_VERIFY_TIMEOUT)
+    except FutureTimeoutError:
+        # Drops the check if it is still queued; a running one finishes
+        future.cancel()
+        raise LoginBusyError("Login is taking too long, please try again shortly")
+
+
+def verify_password(
+    username: str,
+    password: str,
+    password_hash: Optional[str],
+    client: str,
+    remember_seconds: float,
+) -> bool:
+    """
+    Check a password with rate limiting, caching and an off-thread bcrypt.
+
+    Args:
+        username (str): The entered username.
+        password (str): The entered password.
+        password_hash (Optional[str]): The stored bcrypt hash, None for unknown users.
+        client (str): The client's address, for per-client limits.
+        remember_seconds (float): How long a successful check is remembered.
+
+    Returns:
+        bool: True if the password matches.
+
+    Raises:
+        LoginRateLimitedError: If the username or client is temporarily blocked.
+        LoginBusyError: If the verification pool is saturated.
+    """
+    global _dummy_hash
+
+    wait = max(_user_limiter.retry_after(username), _ip_limiter.retry_after(client))
+    if wait > 0:
+        raise LoginRateLimitedError(
+            f"Too many failed logins, please try again in {wait:.0f}s"
+        )
+
+    if password_hash is not None and _verified.check(username, password, password_hash):
+        return True
+
+    if password_hash is None:
+        # Unknown users still pay for one check, so timing does not reveal them
+        if _dummy_hash is None:
+            _dummy_hash = bcrypt.hashpw(b"", bcrypt.gensalt())
+        _check_in_pool(password, _dummy_hash)
+        valid = False
+    else:
+        valid = _check_in_pool(password, password_hash.encode())
+
+    if valid:
+        _user_limiter.reset(username)
+        _verified.remember(username, password, password_hash, remember_seconds)
+    else:
+        _user_limiter.record_failure(username)
+        _ip_limiter.record_failure(client)
+    return valid
+
+
+def _strip_port(address: str) -> str:
+    # "1.2.3.4:5678" -> "1.2.3.4", "[::1]:5678" -> "::1"; bare IPv6 is kept
+    if address.startswith("["):
+        return address[1 : address.find("]")]
+    if address.count(":") == 1:
+        return address.split(":")[0]
+    return address
+
+
+def client_address(forwarded: Optional[str], peer: Optional[str]) -> str:
+    """
+    Return the client address to rate limit on.
+
+    Entries of X-Forwarded-For left of the trusted proxies' hops are set by
+    the client and can be spoofed, so the hop the outermost trusted proxy
+    appended is used.
+
+    :param forwarded: The X-Forwarded-For header, if any.
+    :param peer: The address of the connection's peer.
+    :return: The client address, "unknown" if there is none.
+    """
+    hops = [hop.strip() for hop in (forwarded or "").split(",") if hop.strip()]
+    if LOGIN_TRUSTED_PROXIES > 0 and len(hops) >= LOGIN_TRUSTED_PROXIES:
+        return _strip_port(hops[-LOGIN_TRUSTED_PROXIES])
+    return peer or "unknown"
+
+
+def _client_address() -> str:
+    return client_address(
+        st.context.headers.get("X-Forwarded-For"),
+        getattr(st.context, "ip_address", None),
+    )
+
+
+def login(authenticator) -> None:
+    """
+    Render the login form and authenticate the session.
+
+    Cookie re-authentication stays with the authenticator (it only checks a
+    signed token). Submitted passwords are verified by `verify_password`
+    rather than on the script thread.
+
+    :param authenticator: The session's `stauth.Authenticate` object.
+    """
+    # Restores the session from the re-authentication cookie, without bcrypt
+    authenticator.login(location="unrendered")
+    if st.session_state["authentication_status"]:
+        return
+
+    with st.form("Login"):
+        st.subheader("Login")
+        username = st.text_input("Username")
+        password = st.text_input("Password", type="password")
+        submitted = st.form_submit_button("Login")
+    if not submitted or not username:
+        return
+
+    username = username.strip().lower()
+    # One indexed lookup, rather than a scan of every user
+    user = get_credential_backend().get_user(username)
+    expiry_days = get_config()["cookie"]["expiry_days"]
+    try:
+        valid = verify_password(
+            username,
+            password,
+            user["password"] if user else None,
+            _client_address(),
+            remember_seconds=expiry_days * 86400,
+        )
+    except (LoginRateLimitedError, LoginBusyError) as e:
+        st.error(e)
+        return
+
+    if not valid:
+        st.session_state["authentication_status"] = False
+        return
+
+    st.session_state["username"] = username
+    st.session_state["name"] = user["name"]
+    st.session_state["authentication_status"] = True
+    st.session_state["logout"] = None
+    # The authenticator's own bookkeeping, which its logout expects
+    model = authenticator.authentication_controller.authentication_model
+    model.credentials["usernames"].setdefault(username, user)["logged_in"] = True
+    # Later sessions in this browser log in from the cookie, with no bcrypt at all
+    authenticator.cookie_controller.set_cookie()
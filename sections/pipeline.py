@@ -0,0 +1,170 @@
+import os
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterator, MutableMapping, Optional
+
+# Number of completions that may stream concurrently in this process
+PIPELINE_WORKERS = int(os.getenv("CHAT_PIPELINE_WORKERS", "32"))
+# How often a reader waiting for the next delta wakes up to check for a cancel
+PIPELINE_POLL_SECONDS = float(os.getenv("CHAT_PIPELINE_POLL_SECONDS", "0.25"))
+
+_executor = ThreadPoolExecutor(
+    max_workers=PIPELINE_WORKERS, thread_name_prefix="completion"
+)
+
+# Marks the end of a task's output queue
+_DONE = object()
+
+# Session state key holding the completion currently streaming for a session
+ACTIVE_COMPLETION_KEY = "active_completion"
+
+
+class CompletionTask:
+    """
+    A streaming chat completion running on a worker thread.
+
+    The Streamlit script thread only reads deltas from a queue, polling it so
+    that it is never blocked inside the HTTP call and can abandon the request
+    between polls.
+    Cancelling closes the underlying HTTP stream, which stops generation (and
+    billing) on the server side.
+    """
+
+    def __init__(self, open_stream: Callable[[], Any]):
+        """
+        Start streaming in the background.
+
+        Args:
+            open_stream (Callable[[], Any]): Opens the completion stream, e.g. a
+                call to `client.chat.completions.create(..., stream=True)`.
+        """
+        self._queue: "queue.Queue[Any]" = queue.Queue()
+        self._cancelled = threading.Event()
+        self._stream = None
+        self._stream_lock = threading.Lock()
+        self._finished = False
+        self.future = _executor.submit(self._run, open_stream)
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    def _run(self, open_stream: Callable[[], Any]) -> None:
+        try:
+            stream = open_stream()
+            with self._stream_lock:
+                self._stream = stream
+            if self.cancelled:
+                return
+            for chunk in stream:
+                if self.cancelled:
+                    return
+                # Some chunks (e.g. the final one) carry no choices or no content
+                if not chunk.choices:
+                    continue
+                delta = chunk.choices[0].delta.content
+                if delta:
+                    self._queue.put(delta)
+        except Exception as e:
+            # Errors after a cancel come from closing the stream under the reader
+            if not self.cancelled:
+                self._queue.put(e)
+        finally:
+            self._close_stream()
+            self._queue.put(_DONE)
+
+    def _close_stream(self) -> None:
+        with self._stream_lock:
+            stream, self._stream = self._stream, None
+        if stream is not None:
+            try:
+                stream.close()
+            except Exception:
+                pass
+
+    def cancel(self) -> None:
+        """Stop the completion and release its HTTP connection."""
+        if self._finished:
+            return
+        self._cancelled.set()
+        self.future.cancel()  # In case it never started
+        self._close_stream()
+
+    def deltas(
+        self,
+        on_wait: Optional[Callable[[float], None]] = None,
+        poll_seconds: float = PIPELINE_POLL_SECONDS,
+    ) -> Iterator[str]:
+        """
+        Yield content deltas as the worker receives them.
+
+        The reader never blocks for longer than `poll_seconds`: while no delta
+        arrives, it stops if the task was cancelled and otherwise calls
+        `on_wait`. Streamlit can only stop a script run inside an `st` call, so
+        an `on_wait` that updates an element lets a rerun (a new prompt, a
+        cleared session) interrupt even the wait for the first token. If the
+        consumer stops early, which closes this generator, the task is
+        cancelled.
+
+        Args:
+            on_wait (Optional[Callable[[float], None]]): Called with the
+                seconds waited since the last delta, once per idle poll.
+            poll_seconds (float): The longest wait between two checks.
+
+        Yields:
+            str: Content deltas in arrival order.
+        """
+        try:
+            waiting_since = time.perf_counter()
+            while True:
+                try:
+                    item = self._queue.get(timeout=poll_seconds)
+                except queue.Empty:
+                    if self.cancelled:
+                        return
+                    if on_wait is not None:
+                        on_wait(time.perf_counter() - waiting_since)
+                    continue
+                if item is _DONE:
+                    self._finished = True
+                    return
+                if isinstance(item, Exception):
+                    self._finished = True
+                    raise item
+                yield item
+                waiting_since = time.perf_counter()
+        finally:
+            if not self._finished:
+                self.cancel()
+
+
+def start_completion(
+    state: MutableMapping, open_stream: Callable[[], Any]
+) -> CompletionTask:
+    """
+    Start a completion for a session, cancelling the one it replaces.
+
+    Args:
+        state (MutableMapping): The session state of the requesting user.
+        open_stream (Callable[[], Any]): Opens the completion stream.
+
+    Returns:
+        CompletionTask: The running task.
+    """
+    cancel_active_completion(state)
+    task = CompletionTask(open_stream)
+    state[ACTIVE_COMPLETION_KEY] = task
+    return task
+
+
+def cancel_active_completion(state: MutableMapping) -> None:
+    """
+    Cancel the completion still streaming for a session, if any.
+
+    :param state: The session state of the user.
+    """
+    task = state.pop(ACTIVE_COMPLETION_KEY, None)
+    if task is not None:
+        task.cancel()
@@ -0,0 +1,51 @@
+import importlib
+import sys
+import time
+from typing import Callable, Dict
+
+# Sidebar title -> "module:function" of each page. A page's module is only
+# imported the first time the page is selected.
+PAGES: Dict[str, str] = {
+    "Software Engineer Basics": "sections.software_engineer_basics:software_engineer_basics",
+    "Basic ChatGPT": "sections.chatbot:run_chatbot",
+    "Python Agent": "sections.agent_py_programmer:run_agent_py_programmer",
+}
+
+# Milliseconds from the first import of each page module to the end of its
+# first render in this process. Pages import their dependencies (engine,
+# NumPy, stores) inside the render function, so the module import alone
+# would miss most of the cold cost.
+first_load_ms: Dict[str, float] = {}
+
+
+def load_page(name: str) -> Callable[[], None]:
+    """
+    Return the render function of a page, importing its module on first use.
+
+    Until the page has rendered once in this process, the returned function
+    also records its cold load time in `first_load_ms`.
+
+    Args:
+        name (str): The page title shown in the sidebar.
+
+    Returns:
+        Callable[[], None]: The function that renders the page.
+
+    Raises:
+        KeyError: If no page has this title.
+    """
+    module_name, function_name = PAGES[name].split(":")
+    started = time.perf_counter()
+    module = sys.modules.get(module_name) or importlib.import_module(module_name)
+    render = getattr(module, function_name)
+    if module_name in first_load_ms:
+        return render
+
+    def render_and_time() -> None:
+        try:
+            render()
+        finally:
+            elapsed_ms = round((time.perf_counter() - started) * 1000, 2)
+            first_load_ms.setdefault(module_name, elapsed_ms)
+
+    return render_and_time
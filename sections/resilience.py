@@ -0,0 +1,342 @@
+import os
+import queue
+import random
+import threading
+import time
+from collections import deque
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Optional
+
+# Retry settings, overridable from the environment
+RETRY_ATTEMPTS = int(os.getenv("OPENAI_RETRY_ATTEMPTS", "4"))
+RETRY_BASE_DELAY = float(os.getenv("OPENAI_RETRY_BASE_DELAY", "0.5"))
+RETRY_MAX_DELAY = float(os.getenv("OPENAI_RETRY_MAX_DELAY", "20"))
+
+# Circuit breaker settings
+BREAKER_FAILURES = int(os.getenv("OPENAI_BREAKER_FAILURES", "5"))
+BREAKER_RESET_SECONDS = float(os.getenv("OPENAI_BREAKER_RESET", "30"))
+
+# Hedged request settings
+HEDGE_ENABLED = os.getenv("OPENAI_HEDGE", "0") == "1"
+HEDGE_DEFAULT_DELAY = float(os.getenv("OPENAI_HEDGE_DELAY", "3"))
+HEDGE_MIN_SAMPLES = 20
+
+# HTTP statuses worth retrying besides 5xx
+_RETRYABLE_STATUS = {408, 409, 429}
+
+
+class CircuitOpenError(RuntimeError):
+    """Raised when the circuit breaker is rejecting calls."""
+
+
+def is_retryable(error: Exception) -> bool:
+    """
+    Check whether an OpenAI error is transient.
+
+    :param error: The exception raised by the SDK.
+    :return: True for timeouts, connection errors, 408/409/429 and 5xx responses.
+    """
+    # Only reached once a request failed, so the SDK is already loaded
+    import openai
+
+    if isinstance(error, openai.APIConnectionError):  # Includes timeouts
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code in _RETRYABLE_STATUS or error.status_code >= 500
+    return False
+
+
+def retry_after(error: Exception) -> Optional[float]:
+    """
+    Read the server's requested wait from a `Retry-After` style header.
+
+    :param error: The exception raised by the SDK.
+    :return: The delay in seconds, or None if the server did not ask for one.
+    """
+    response = getattr(error, "response", None)
+    headers = getattr(response, "headers", None)
+    if not headers:
+        return None
+
+    value = headers.get("retry-after-ms")
+    if value:
+        try:
+            return float(value) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("retry-after")
+    if not value:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        # HTTP-date form
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+def backoff_delay(attempt: int) -> float:
+    """
+    Exponential backoff with full jitter.
+
+    :param attempt: The zero-based number of the failed attempt.
+    :return: A random delay in [0, min(max delay, base * 2**attempt)].
+    """
+    return random.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2**attempt))
+
+
+class CircuitBreaker:
+    """
+    Stop calling a failing API for a while instead of piling up retries.
+
+    After `failure_threshold` consecutive transient failures the breaker opens
+    and rejects calls for `reset_seconds`. It then lets one trial call through
+    (half-open); success closes it, failure opens it again.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = BREAKER_FAILURES,
+        reset_seconds: float = BREAKER_RESET_SECONDS,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._opened_at is None:
+                return "closed"
+            if time.monotonic() - self._opened_at >= self.reset_seconds:
+                return "half-open"
+            return "open"
+
+    def before_call(self) -> None:
+        """
+        Check that a call may proceed.
+
+        :raises CircuitOpenError: If the breaker is open, or half-open with a
+            trial call already in flight.
+        """
+        with self._lock:
+            if self._opened_at is None:
+                return
+            remaining = self.reset_seconds - (time.monotonic() - self._opened_at)
+            if remaining > 0 or self._trial_running:
+                raise CircuitOpenError(
+                    f"OpenAI API is failing, calls paused for {max(remaining, 0):.0f}s"
+                )
+            self._trial_running = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._failures = 0
+            self._opened_at = None
+            self._trial_running = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._failures += 1
+            self._trial_running = False
+            if self._opened_at is not None or self._failures >= self.failure_threshold:
+                self._opened_at = time.monotonic()
+
+
+def call_with_retry(
+    fn: Callable[[], Any],
+    breaker: Optional[CircuitBreaker] = None,
+    attempts: int = RETRY_ATTEMPTS,
+    sleep: Callable[[float], None] = time.sleep,
+) -> Any:
+    """
+    Call `fn`, retrying transient OpenAI errors with backoff.
+
+    Args:
+        fn (Callable[[], Any]): The API call to make.
+        breaker (Optional[CircuitBreaker]): Breaker guarding the API.
+        attempts (int): The maximum number of calls.
+        sleep (Callable[[float], None]): Sleep function, replaceable in tests.
+
+    Returns:
+        Any: Whatever `fn` returns.
+
+    Raises:
+        CircuitOpenError: If the breaker rejects the call.
+        Exception: The last error once retries are exhausted, or any
+            non-transient error immediately.
+    """
+    for attempt in range(attempts):
+        if breaker is not None:
+            breaker.before_call()
+        try:
+            result = fn()
+        except Exception as e:
+            if not is_retryable(e):
+                if breaker is not None:
+                    # The API answered, it is just rejecting this request
+                    breaker.record_success()
+                raise
+            if breaker is not None:
+                breaker.record_failure()
+            if attempt == attempts - 1:
+                raise
+            delay = retry_after(e)
+            if delay is None:
+                delay = backoff_delay(attempt)
+            sleep(min(delay, RETRY_MAX_DELAY))
+        else:
+            if breaker is not None:
+                breaker.record_success()
+            return result
+
+
+class LatencyTracker:
+    """Rolling window of time-to-first-token samples."""
+
+    def __init__(self, window: int = 200):
+        self._samples: deque = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float) -> None:
+        with self._lock:
+            self._samples.append(seconds)
+
+    def p95(self, default: float = HEDGE_DEFAULT_DELAY) -> float:
+        """
+        Return the 95th percentile, or `default` until enough samples exist.
+
+        :param default: Value used while the window is still warming up.
+        :return: The p95 latency in seconds.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+        if len(samples) < HEDGE_MIN_SAMPLES:
+            return default
+        return samples[min(int(len(samples) * 0.95), len(samples) - 1)]
+
+
+class _PrefetchedStream:
+    """A stream whose first chunks were already read while racing another request."""
+
+    def __init__(self, stream: Any, iterator: Any, buffered: list):
+        self._stream = stream
+        self._iterator = iterator
+        self._buffered = buffered
+
+    def __iter__(self):
+        yield from self._buffered
+        yield from self._iterator
+
+    def close(self) -> None:
+        self._stream.close()
+
+
+def _has_content(chunk: Any) -> bool:
+    return bool(chunk.choices and chunk.choices[0].delta.content)
+
+
+def _close_quietly(stream: Any) -> None:
+    try:
+        stream.close()
+    except Exception:
+        pass
+
+
+def hedged_open(
+    open_stream: Callable[[], Any],
+    hedge_after: float,
+    tracker: Optional[LatencyTracker] = None,
+) -> Any:
+    """
+    Open a completion stream, racing a second request if the first is slow.
+
+    If the first request has not produced a token after `hedge_after` seconds,
+    an identical request is started and whichever yields a token first wins;
+    the loser's stream is closed so it stops generating.
+
+    Args:
+        open_stream (Callable[[], Any]): Opens one completion stream.
+        hedge_after (float): Seconds to wait for a first token before hedging.
+        tracker (Optional[LatencyTracker]): Receives the winner's time to first token.
+
+    Returns:
+        Any: An iterable stream with a `close()` method.
+    """
+    results: "queue.Queue[tuple]" = queue.Queue()
+    started = time.perf_counter()
+
+    def attempt() -> None:
+        stream = None
+        try:
+            stream = open_stream()
+            iterator = iter(stream)
+            buffered = []
+            for chunk in iterator:
+                buffered.append(chunk)
+                if _has_content(chunk):
+                    break
+            results.put((stream, iterator, buffered, None))
+        except Exception as e:
+            if stream is not None:
+                _close_quietly(stream)
+            results.put((None, None, None, e))
+
+    threading.Thread(target=attempt, daemon=True).start()
+    launched = 1
+    try:
+        result = results.get(timeout=hedge_after)
+    except queue.Empty:
+        threading.Thread(target=attempt, daemon=True).start()
+        launched = 2
+        result = results.get()
+    pending = launched - 1
+
+    # If the first attempt to finish failed, fall back to the other one
+    if result[3] is not None and pending:
+        result = results.get()
+        pending -= 1
+
+    def close_losers(count: int) -> None:
+        for _ in range(count):
+            loser = results.get()
+            if loser[0] is not None:
+                _close_quietly(loser[0])
+
+    if pending:
+        threading.Thread(target=close_losers, args=(pending,), daemon=True).start()
+
+    stream, iterator, buffered, error = result
+    if error is not None:
+        raise error
+    if tracker is not None:
+        tracker.record(time.perf_counter() - started)
+    return _PrefetchedStream(stream, iterator, buffered)
+
+
+# Process-wide breaker and latency window shared by every session
+breaker = CircuitBreaker()
+ttft_tracker = LatencyTracker()
+
+
+def open_resilient_stream(open_stream: Callable[[], Any]) -> Any:
+    """
+    Open a completion stream with retries, the circuit breaker and optional hedging.
+
+    :param open_stream: Opens one completion stream.
+    :return: An iterable stream with a `close()` method.
+    """
+
+    def open_with_retry() -> Any:
+        return call_with_retry(open_stream, breaker=breaker)
+
+    if HEDGE_ENABLED:
+        return hedged_open(open_with_retry, ttft_tracker.p95(), tracker=ttft_tracker)
+    return open_with_retry()
@@ -0,0 +1,99 @@
+"""
+A subprocess pool for running the guide's algorithms away from the app server.
+
+Every task runs in a fresh interpreter (`python -m sections.sandbox`) that
+first limits its own CPU time and address space. At most `SANDBOX_WORKERS`
+tasks run at once, and a task is killed after `SANDBOX_TIMEOUT_SECONDS`, so a
+runaway task cannot exhaust the container.
+
+The function and its arguments travel to the worker pickled on stdin (the
+function by reference, so it must be defined at module level), and the
+result comes back pickled on stdout.
+
+A subprocess rather than a multiprocessing pool: Streamlit replaces
+`__main__` with the page script, which multiprocessing's spawn and
+forkserver workers would run again on start-up.
+"""
+
+import os
+import pickle
+import subprocess
+import sys
+import threading
+from typing import Any, Callable
+
+SANDBOX_WORKERS = int(os.getenv("SANDBOX_WORKERS", "2"))
+SANDBOX_TIMEOUT_SECONDS = float(os.getenv("SANDBOX_TIMEOUT_SECONDS", "60"))
+SANDBOX_MEMORY_MB = int(os.getenv("SANDBOX_MEMORY_MB", "1024"))
+
+# The repository root, so the worker can import `sections`
+_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+_slots = threading.BoundedSemaphore(SANDBOX_WORKERS)
+
+
+class SandboxError(RuntimeError):
+    """Raised when a sandboxed task failed, timed out or hit its limits."""
+
+
+def run_sandboxed(
+    fn: Callable, *args: Any, timeout: float = SANDBOX_TIMEOUT_SECONDS
+) -> Any:
+    """
+    Run a function in a resource-limited worker process and return its result.
+
+    Args:
+        fn (Callable): A module-level function.
+        *args (Any): Its picklable arguments.
+        timeout (float): Seconds before the worker is killed.
+
+    Returns:
+        Any: The function's return value.
+
+    Raises:
+        SandboxError: If the task raised, timed out, or its worker was killed
+            (e.g. for exceeding its CPU or memory limit).
+    """
+    # Waiting for a slot counts against the timeout too
+    if not _slots.acquire(timeout=timeout):
+        raise SandboxError("All sandbox workers are busy, please try again shortly")
+    try:
+        result = subprocess.run(
+            [sys.executable, "-m", "sections.sandbox", str(int(timeout) + 1)],
+            input=pickle.dumps((fn, args)),
+            capture_output=True,
+            cwd=_ROOT,
+            timeout=timeout,
+        )
+    except subprocess.TimeoutExpired:
+        raise SandboxError(f"Timed out after {timeout:.0f}s")
+    finally:
+        _slots.release()
+
+    if result.returncode != 0:
+        # Killed by a signal (e.g. SIGXCPU), or an exception: keep the last line
+        lines = result.stderr.decode(errors="replace").strip().splitlines()
+        reason = lines[-1] if lines else f"exit code {result.returncode}"
+        raise SandboxError(f"The task failed: {reason}")
+    return pickle.loads(result.stdout)
+
+
+def _limit_resources(cpu_seconds: int, memory_bytes: int) -> None:
+    # rlimits only exist on Unix; elsewhere only the timeout applies
+    try:
+        import resource
+    except ImportError:
+        return
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds + 1))
+    resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+
+
+def main() -> None:
+    _limit_resources(int(sys.argv[1]), SANDBOX_MEMORY_MB * 1024 * 1024)
+    fn, args = pickle.loads(sys.stdin.buffer.read())
+    result = fn(*args)
+    sys.stdout.buffer.write(pickle.dumps(result))
+
+
+if __name__ == "__main__":
+    main()
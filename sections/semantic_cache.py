@@ -0,0 +1,201 @@
+import hashlib
+import os
+import re
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+
+# Semantic cache settings, overridable from the environment
+SEMANTIC_CACHE_ENABLED = os.getenv("SEMANTIC_CACHE_ENABLED", "0") == "1"
+SEMANTIC_CACHE_THRESHOLD = float(os.getenv("SEMANTIC_CACHE_THRESHOLD", "0.97"))
+SEMANTIC_CACHE_MAX_ENTRIES = int(os.getenv("SEMANTIC_CACHE_MAX_ENTRIES", "2048"))
+SEMANTIC_CACHE_TTL = float(os.getenv("SEMANTIC_CACHE_TTL", "3600"))
+EMBEDDING_DIM = int(os.getenv("SEMANTIC_CACHE_DIM", "1024"))
+
+# Words that do not change the meaning of a prompt
+_IGNORED_WORDS = frozenset(("a", "an", "the"))
+
+
+def normalize_words(text: str) -> List[str]:
+    """
+    Split a prompt into lowercase words, without punctuation or articles.
+
+    :param text: The prompt.
+    :return: Its words, in order.
+    """
+    words = re.sub(r"[^\w\s]", " ", text.lower()).split()
+    return [word for word in words if word not in _IGNORED_WORDS]
+
+
+def embed_text(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Embed text as a hashed bag of character trigrams and words.
+
+    This runs on the CPU in microseconds and needs no model download. Prompts
+    that differ only in case, punctuation, spacing or articles ("What is large
+    language model?" / "what is a large-language model") score 1.
+
+    It is not a semantic model, and it ignores word order: prompts that differ
+    by a prefix ("supervised" / "unsupervised learning") score around 0.85,
+    and prompts with swapped words ("convert celsius to fahrenheit" /
+    "convert fahrenheit to celsius") score 0.9 to 1. A high score alone is
+    therefore never enough for a match (see `SemanticCache`).
+
+    Args:
+        text (str): The text to embed.
+        dim (int): The number of hash buckets.
+
+    Returns:
+        np.ndarray: A unit-length float32 vector of shape (dim,).
+    """
+    text = " ".join(normalize_words(text))
+    padded = f" {text} "
+    features = [padded[i : i + 3] for i in range(len(padded) - 2)]
+    features += text.split()
+    # crc32 is stable across processes, unlike the built-in hash()
+    buckets = [zlib.crc32(feature.encode("utf-8")) % dim for feature in features]
+    vector = np.bincount(buckets, minlength=dim).astype(np.float32)
+    norm = np.linalg.norm(vector)
+    if norm > 0:
+        vector /= norm
+    return vector
+
+
+def _namespace_id(namespace: str) -> int:
+    # 64-bit digest so namespaces can be compared in a NumPy array
+    digest = hashlib.blake2b(namespace.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little", signed=True)
+
+
+class SemanticCache:
+    """
+    Cache of responses looked up by cosine similarity of the prompt.
+
+    A hit needs both a similarity of at least `threshold` and the same words
+    in the same order as the cached prompt (ignoring case, punctuation and
+    articles), so a changed word ("ascending" / "descending") or a swap
+    ("strings to integers" / "integers to strings") is never answered from
+    the cache. Embeddings live in one preallocated matrix so a lookup is a
+    single matrix-vector product. Entries are scoped by a namespace (e.g. model,
+    system prompt and prior turns) so an answer is only reused in the same
+    context. When full, the least recently used entry is overwritten.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = SEMANTIC_CACHE_MAX_ENTRIES,
+        threshold: float = SEMANTIC_CACHE_THRESHOLD,
+        ttl: float = SEMANTIC_CACHE_TTL,
+        dim: int = EMBEDDING_DIM,
+    ):
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.ttl = ttl
+        self.dim = dim
+        self._vectors = np.zeros((max_entries, dim), dtype=np.float32)
+        self._namespaces = np.zeros(max_entries, dtype=np.int64)
+        self._created = np.zeros(max_entries, dtype=np.float64)
+        self._last_used = np.zeros(max_entries, dtype=np.float64)
+        self._responses: List[Optional[str]] = [None] * max_entries
+        self._words: List[Tuple[str, ...]] = [()] * max_entries
+        self._size = 0
+        self._lock = threading.Lock()
+        self.counters: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    def lookup(self, namespace: str, text: str) -> Optional[Tuple[str, float]]:
+        """
+        Find a cached response for a prompt similar to `text`.
+
+        :param namespace: The context the prompt was asked in.
+        :param text: The user prompt.
+        :return: The cached response and its similarity, or None below the threshold.
+        """
+        query = embed_text(text, self.dim)
+        words = tuple(normalize_words(text))
+        namespace_id = _namespace_id(namespace)
+        now = time.time()
+        with self._lock:
+            if self._size == 0:
+                self.counters["misses"] += 1
+                return None
+
+            size = self._size
+            scores = self._vectors[:size] @ query
+            stale = (self._namespaces[:size] != namespace_id) | (
+                now - self._created[:size] > self.ttl
+            )
+            scores[stale] = -1.0
+
+            # Most similar first, among the entries over the threshold
+            candidates = np.flatnonzero(scores >= self.threshold)
+            candidates = candidates[np.argsort(-scores[candidates])]
+            best = next(
+                (int(slot) for slot in candidates if self._words[slot] == words), None
+            )
+            if best is None:
+                self.counters["misses"] += 1
+                return None
+
+            score = float(scores[best])
+            self._last_used[best] = now
+            self.counters["hits"] += 1
+            return self._responses[best], score
+
+    def add(self, namespace: str, text: str, response: str) -> None:
+        """
+        Cache a response for a prompt.
+
+        :param namespace: The context the prompt was asked in.
+        :param text: The user prompt.
+        :param response: The assistant response.
+        """
+        vector = embed_text(text, self.dim)
+        words = tuple(normalize_words(text))
+        namespace_id = _namespace_id(namespace)
+        now = time.time()
+        with self._lock:
+            if self._size < self.max_entries:
+                slot = self._size
+                self._size += 1
+            else:
+                slot = int(np.argmin(self._last_used))
+                self.counters["evictions"] += 1
+
+            self._vectors[slot] = vector
+            self._namespaces[slot] = namespace_id
+            self._created[slot] = now
+            self._last_used[slot] = now
+            self._responses[slot] = response
+            self._words[slot] = words
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Return hit/miss counters and the number of cached entries.
+
+        :return: A dictionary of counters suitable for display.
+        """
+        with self._lock:
+            stats = dict(self.counters)
+            stats["entries"] = self._size
+        return stats
+
+
+_cache: Optional[SemanticCache] = None
+_cache_lock = threading.Lock()
+
+
+def get_semantic_cache() -> SemanticCache:
+    """
+    Return the process-wide semantic cache, creating it on first use.
+
+    :return: The shared cache.
+    """
+    global _cache
+    if _cache is None:
+        with _cache_lock:
+            if _cache is None:
+                _cache = SemanticCache()
+    return _cache
@@ -0,0 +1,262 @@
+"""
+Memory accounting for the chat history held in session state.
+
+Messages are kept as compact `ChatMessage` records (slots instead of a dict
+per message, roles interned) in a `ChatHistory` list. Every session's history
+is registered with the process-wide `ChatMemory`, which enforces:
+
+- a per-session budget: the oldest messages already persisted to the session
+  store are dropped from memory and paged back in on demand;
+- a per-process budget: the histories of the least recently active sessions
+  are released, and reloaded from the session store on their next rerun.
+"""
+
+import os
+import sys
+import threading
+import time
+import uuid
+import weakref
+from collections import OrderedDict
+from collections.abc import Mapping
+from typing import Iterator, List, MutableMapping, Optional
+
+# Memory budgets of chat history, overridable from the environment
+SESSION_MEMORY_BYTES = int(os.getenv("SESSION_MEMORY_BYTES", str(1024 * 1024)))
+PROCESS_MEMORY_BYTES = int(os.getenv("PROCESS_MEMORY_BYTES", str(256 * 1024 * 1024)))
+# Only sessions inactive for this long are evicted, never one mid-turn
+SESSION_EVICT_IDLE_SECONDS = float(os.getenv("SESSION_EVICT_IDLE_SECONDS", "300"))
+
+# Session state key holding the id the memory registry knows a session by
+SESSION_ID_KEY = "_chat_memory_session_id"
+
+_FIELDS = ("role", "content")
+
+
+class ChatMessage(Mapping):
+    """
+    One chat message, readable and writable like `{"role": ..., "content": ...}`.
+
+    `seq` is the message's sequence number in the session store, or None while
+    it has not been persisted yet.
+    """
+
+    __slots__ = ("role", "content", "seq")
+
+    def __init__(self, role: str, content: str, seq: Optional[int] = None):
+        # All messages of a role share one string object
+        self.role = sys.intern(role)
+        self.content = content
+        self.seq = seq
+
+    @classmethod
+    def from_dict(cls, message: dict) -> "ChatMessage":
+        return cls(message["role"], message["content"], message.get("seq"))
+
+    def __getitem__(self, key: str) -> str:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: str) -> None:
+        if key not in _FIELDS:
+            raise KeyError(key)
+        setattr(self, key, sys.intern(value) if key == "role" else value)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(_FIELDS)
+
+    def __len__(self) -> int:
+        return len(_FIELDS)
+
+    def __repr__(self) -> str:
+        return f"ChatMessage(role={self.role!r}, content={self.content!r}, seq={self.seq})"
+
+    def size(self) -> int:
+        """
+        Estimate the bytes held by this message (the interned role is shared).
+
+        :return: The size of the record plus its content string.
+        """
+        return sys.getsizeof(self) + sys.getsizeof(self.content)
+
+
+class ChatHistory(list):
+    """A list of `ChatMessage` that the memory registry can reference weakly."""
+
+    __slots__ = ("__weakref__",)
+
+
+def compact_messages(messages: List[dict]) -> ChatHistory:
+    """
+    Convert a history of dictionaries into a `ChatHistory` of `ChatMessage`.
+
+    :param messages: The messages; entries that are already compact are kept.
+    :return: The compact history.
+    """
+    return ChatHistory(
+        m if isinstance(m, ChatMessage) else ChatMessage.from_dict(m) for m in messages
+    )
+
+
+class _SessionEntry:
+    __slots__ = ("messages", "bytes", "touched")
+
+    def __init__(self, messages: "weakref.ref[ChatHistory]", size: int):
+        self.messages = messages
+        self.bytes = size
+        self.touched = time.monotonic()
+
+
+class ChatMemory:
+    """Process-wide registry of the chat history held by every session."""
+
+    def __init__(
+        self,
+        session_budget: int = SESSION_MEMORY_BYTES,
+        process_budget: int = PROCESS_MEMORY_BYTES,
+        idle_seconds: float = SESSION_EVICT_IDLE_SECONDS,
+    ):
+        self.session_budget = session_budget
+        self.process_budget = process_budget
+        self.idle_seconds = idle_seconds
+        # Least recently active session first
+        self._sessions: "OrderedDict[str, _SessionEntry]" = OrderedDict()
+        self._evicted = set()
+        self._total_bytes = 0
+        self._lock = threading.Lock()
+        self.counters = {"trimmed_messages": 0, "evicted_sessions": 0}
+
+    @staticmethod
+    def _session_id(state: MutableMapping) -> str:
+        if SESSION_ID_KEY not in state:
+            state[SESSION_ID_KEY] = uuid.uuid4().hex
+        return state[SESSION_ID_KEY]
+
+    def was_evicted(self, state: MutableMapping) -> bool:
+        """
+        Tell whether the session's history was released since its last run.
+
+        :param state: The session state.
+        :return: True once after an eviction; the caller reloads the history.
+        """
+        with self._lock:
+            session_id = self._session_id(state)
+            if session_id in self._evicted:
+                self._evicted.discard(session_id)
+                return True
+            return False
+
+    def track(self, state: MutableMapping, trim: bool = True) -> Optional[int]:
+        """
+        Account for the session's history and enforce both memory budgets.
+
+        Converts `state["messages"]` to a compact `ChatHistory`, drops its
+        oldest persisted messages while it is over the per-session budget (if
+        `trim`), then releases idle sessions while the process is over its
+        budget.
+
+        Args:
+            state (MutableMapping): The session state holding `messages`.
+            trim (bool): Whether to enforce the per-session budget now.
+
+        Returns:
+            Optional[int]: If messages were dropped, the sequence number the
+            store should page backwards from to get them again; else None.
+        """
+        messages = state["messages"]
+        if not isinstance(messages, ChatHistory) or not all(
+            isinstance(m, ChatMessage) for m in messages
+        ):
+            messages = state["messages"] = compact_messages(messages)
+
+        dropped = self._trim(messages) if trim else []
+        size = sum(m.size() for m in messages)
+
+        with self._lock:
+            session_id = self._session_id(state)
+            entry = self._sessions.pop(session_id, None)
+            if entry is not None:
+                self._total_bytes -= entry.bytes
+            self._sessions[session_id] = _SessionEntry(weakref.ref(messages), size)
+            self._total_bytes += size
+            self.counters["trimmed_messages"] += len(dropped)
+            self._evict_idle(keep=session_id)
+        return dropped[-1].seq + 1 if dropped else None
+
+    def _trim(self, messages: ChatHistory) -> List[ChatMessage]:
+        # The system prompt and the newest message stay. Only messages the
+        # store can page back in go; unsaved ones (no seq) are kept in place
+        head = 1 if messages and messages[0].role == "system" else 0
+        size = sum(m.size() for m in messages)
+        dropped, kept = [], []
+        for message in messages[head:-1]:
+            if size > self.session_budget and message.seq is not None:
+                size -= message.size()
+                dropped.append(message)
+            else:
+                kept.append(message)
+        if dropped:
+            messages[head:-1] = kept
+        return dropped
+
+    def _evict_idle(self, keep: str) -> None:
+        # Caller holds the lock: release least recently active sessions first
+        now = time.monotonic()
+        for session_id, entry in list(self._sessions.items()):
+            if self._total_bytes <= self.process_budget:
+                break
+            if session_id == keep:
+                continue
+            if now - entry.touched < self.idle_seconds:
+                break  # Every later session was active even more recently
+            del self._sessions[session_id]
+            self._total_bytes -= entry.bytes
+            messages = entry.messages()
+            if messages is None:
+                continue  # The session already ended
+            # Its turns are in the session store; the next rerun reloads them
+            messages.clear()
+            self._evicted.add(session_id)
+            self.counters["evicted_sessions"] += 1
+
+    def stats(self) -> dict:
+        """
+        Report the chat history memory gauge.
+
+        :return: Total bytes held, session count, budgets and eviction counters.
+        """
+        with self._lock:
+            # Sessions that ended no longer hold their history
+            for session_id in [
+                session_id
+                for session_id, entry in self._sessions.items()
+                if entry.messages() is None
+            ]:
+                self._total_bytes -= self._sessions.pop(session_id).bytes
+            stats = dict(self.counters)
+            stats.update(
+                total_bytes=self._total_bytes,
+                sessions=len(self._sessions),
+                session_budget=self.session_budget,
+                process_budget=self.process_budget,
+            )
+            return stats
+
+
+_memory: Optional[ChatMemory] = None
+_memory_lock = threading.Lock()
+
+
+def get_chat_memory() -> ChatMemory:
+    """
+    Return the process-wide chat memory registry.
+
+    :return: The shared registry.
+    """
+    global _memory
+    if _memory is None:
+        with _memory_lock:
+            if _memory is None:
+                _memory = ChatMemory()
+    return _memory
@@ -0,0 +1,352 @@
+"""
+Server-side chat history, so conversations survive reruns, restarts and
+moving between replicas, as long as the store itself is persistent: the
+default SQLite file lives in the container's working directory and is lost
+with it (see "Persistent Data" in the README).
+
+Messages are stored per authenticated username. A new session only loads the
+most recent `SESSION_LOAD_MESSAGES`; older turns are paged in on demand, and
+each conversation is compacted to its newest `SESSION_MAX_MESSAGES`. SQLite is
+the default backend; set `SESSION_BACKEND=redis` to share history between
+replicas through Redis.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections.abc import Mapping
+from typing import List, MutableMapping, Optional, Tuple
+
+from sections.session_memory import ChatMessage, get_chat_memory
+
+# Session store settings, overridable from the environment
+SESSION_BACKEND = os.getenv("SESSION_BACKEND", "sqlite")
+SESSION_DB_PATH = os.getenv("SESSION_DB_PATH", "sessions.db")
+SESSION_REDIS_URL = os.getenv("SESSION_REDIS_URL", "redis://localhost:6379/0")
+# Messages restored when a session starts, and per "load earlier" click
+SESSION_LOAD_MESSAGES = int(os.getenv("SESSION_LOAD_MESSAGES", "50"))
+# Messages kept per conversation; older ones are compacted away
+SESSION_MAX_MESSAGES = int(os.getenv("SESSION_MAX_MESSAGES", "1000"))
+
+# All chat pages share one conversation, as they share st.session_state.messages
+DEFAULT_CONVERSATION = "chat"
+
+# Session state keys used to page older messages in from the store
+OLDEST_SEQ_KEY = "history_oldest_seq"
+HAS_OLDER_KEY = "history_has_older"
+# Session state key of the user whose history `messages` holds
+HISTORY_OWNER_KEY = "history_owner"
+
+
+class SessionStore(ABC):
+    """
+    Interface of a chat history store keyed by username and conversation.
+
+    Every stored message gets an increasing sequence number, which is used to
+    page backwards through long histories.
+    """
+
+    @abstractmethod
+    def append(self, username: str, conversation: str, messages: List[dict]) -> int:
+        """
+        Append messages to a conversation and compact it if it grew too long.
+
+        :param username: The authenticated user.
+        :param conversation: The conversation name.
+        :param messages: Messages with `role` and `content`.
+        :return: The sequence number given to the first appended message.
+        """
+
+    @abstractmethod
+    def load_older(
+        self,
+        username: str,
+        conversation: str,
+        before_seq: Optional[int],
+        limit: int,
+    ) -> List[ChatMessage]:
+        """
+        Load the messages just before `before_seq` (the newest if None).
+
+        Args:
+            username (str): The authenticated user.
+            conversation (str): The conversation name.
+            before_seq (Optional[int]): Load messages older than this sequence number.
+            limit (int): The maximum number of messages to load.
+
+        Returns:
+            List[ChatMessage]: The messages in chronological order, with their
+            sequence numbers.
+        """
+
+    @abstractmethod
+    def clear(self, username: str, conversation: str) -> None:
+        """
+        Delete a conversation.
+
+        :param username: The authenticated user.
+        :param conversation: The conversation name.
+        """
+
+
+class SQLiteSessionStore(SessionStore):
+    """Chat history in a SQLite file, safe for several processes to share."""
+
+    def __init__(self, path: str = SESSION_DB_PATH, max_messages: int = SESSION_MAX_MESSAGES):
+        self.path = path
+        self.max_messages = max_messages
+        self._local = threading.local()
+        self._connection().execute(
+            "CREATE TABLE IF NOT EXISTS messages ("
+            "username TEXT NOT NULL, conversation TEXT NOT NULL, seq INTEGER NOT NULL, "
+            "role TEXT NOT NULL, content TEXT NOT NULL, created REAL NOT NULL, "
+            "PRIMARY KEY (username, conversation, seq))"
+        )
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        db = getattr(self._local, "db", None)
+        if db is None:
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA busy_timeout=30000")
+            self._local.db = db
+        return db
+
+    def append(self, username: str, conversation: str, messages: List[dict]) -> int:
+        db = self._connection()
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            last = db.execute(
+                "SELECT MAX(seq) FROM messages WHERE username = ? AND conversation = ?",
+                (username, conversation),
+            ).fetchone()[0]
+            last = -1 if last is None else last
+            now = time.time()
+            db.executemany(
+                "INSERT INTO messages VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (username, conversation, last + 1 + i, m["role"], m["content"], now)
+                    for i, m in enumerate(messages)
+                ],
+            )
+            # Compaction: keep only the newest `max_messages` of the conversation
+            db.execute(
+                "DELETE FROM messages WHERE username = ? AND conversation = ? "
+                "AND seq <= ?",
+                (username, conversation, last + len(messages) - self.max_messages),
+            )
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        return last + 1
+
+    def load_older(
+        self,
+        username: str,
+        conversation: str,
+        before_seq: Optional[int],
+        limit: int,
+    ) -> List[ChatMessage]:
+        rows = self._connection().execute(
+            "SELECT seq, role, content FROM messages "
+            "WHERE username = ? AND conversation = ? AND seq < ? "
+            "ORDER BY seq DESC LIMIT ?",
+            (
+                username,
+                conversation,
+                before_seq if before_seq is not None else 2**62,
+                limit,
+            ),
+        ).fetchall()
+        rows.reverse()
+        return [ChatMessage(role, content, seq) for seq, role, content in rows]
+
+    def clear(self, username: str, conversation: str) -> None:
+        self._connection().execute(
+            "DELETE FROM messages WHERE username = ? AND conversation = ?",
+            (username, conversation),
+        )
+
+
+class RedisSessionStore(SessionStore):
+    """
+    Chat history in a Redis sorted set per conversation, scored by sequence.
+
+    Works with any client exposing the redis-py commands used here (`incrby`,
+    `pipeline`, `zadd`, `zremrangebyrank`, `zrevrangebyscore`, `delete`), e.g.
+    `redis.Redis` against Redis, Azure Cache for Redis or a local stand-in
+    such as `fakeredis`.
+
+    Appends from several replicas or tabs may interleave, so every step is
+    atomic on its own: INCRBY on a companion counter key reserves a block of
+    sequence numbers, the messages and the compaction are written in one
+    MULTI transaction, and a page of older messages is one range query by
+    score, which compaction cannot shift.
+    """
+
+    def __init__(self, client, max_messages: int = SESSION_MAX_MESSAGES):
+        self.client = client
+        self.max_messages = max_messages
+
+    @staticmethod
+    def _keys(username: str, conversation: str) -> Tuple[str, str]:
+        base = f"chat:{username}:{conversation}"
+        return f"{base}:messages", f"{base}:seq"
+
+    def append(self, username: str, conversation: str, messages: List[dict]) -> int:
+        key, seq_key = self._keys(username, conversation)
+        first = self.client.incrby(seq_key, len(messages)) - len(messages)
+        # The sequence number keeps identical messages distinct members
+        members = {
+            json.dumps({"seq": seq, "role": m["role"], "content": m["content"]}): seq
+            for seq, m in enumerate(messages, first)
+        }
+        pipeline = self.client.pipeline(transaction=True)
+        pipeline.zadd(key, members)
+        # Compaction: keep only the newest `max_messages`
+        pipeline.zremrangebyrank(key, 0, -self.max_messages - 1)
+        pipeline.execute()
+        return first
+
+    def load_older(
+        self,
+        username: str,
+        conversation: str,
+        before_seq: Optional[int],
+        limit: int,
+    ) -> List[ChatMessage]:
+        key, _ = self._keys(username, conversation)
+        items = self.client.zrevrangebyscore(
+            key,
+            "+inf" if before_seq is None else f"({before_seq}",
+            "-inf",
+            start=0,
+            num=limit,
+        )
+        messages = [json.loads(item) for item in reversed(items)]
+        return [ChatMessage(m["role"], m["content"], m["seq"]) for m in messages]
+
+    def clear(self, username: str, conversation: str) -> None:
+        self.client.delete(*self._keys(username, conversation))
+
+
+_store: Optional[SessionStore] = None
+_store_lock = threading.Lock()
+
+
+def get_session_store() -> SessionStore:
+    """
+    Return the process-wide session store selected by `SESSION_BACKEND`.
+
+    :return: The shared store.
+    """
+    global _store
+    if _store is None:
+        with _store_lock:
+            if _store is None:
+                if SESSION_BACKEND == "redis":
+                    try:
+                        import redis
+                    except ImportError as e:
+                        raise RuntimeError(
+                            "SESSION_BACKEND=redis needs the redis package "
+                            "(listed in requirements.txt)"
+                        ) from e
+
+                    _store = RedisSessionStore(redis.Redis.from_url(SESSION_REDIS_URL))
+                else:
+                    _store = SQLiteSessionStore()
+    return _store
+
+
+def restore_history(state: MutableMapping, username: str) -> None:
+    """
+    Load the most recent messages of a user into a new or evicted session.
+
+    :param state: The session state; `messages` is set if missing, malformed,
+        evicted or another user's (logging out keeps session state, so a tab
+        can switch users).
+    :param username: The authenticated user.
+    """
+    memory = get_chat_memory()
+    # Keep the session's messages if they are this user's list of mappings
+    current = state.get("messages")
+    valid = (
+        state.get(HISTORY_OWNER_KEY) == username
+        and isinstance(current, list)
+        and all(isinstance(m, Mapping) for m in current)
+    )
+    if valid and not memory.was_evicted(state):
+        memory.track(state, trim=False)
+        return
+    messages = get_session_store().load_older(
+        username, DEFAULT_CONVERSATION, None, SESSION_LOAD_MESSAGES
+    )
+    state["messages"] = messages
+    state[HISTORY_OWNER_KEY] = username
+    state[OLDEST_SEQ_KEY] = messages[0].seq if messages else None
+    state[HAS_OLDER_KEY] = len(messages) == SESSION_LOAD_MESSAGES
+    memory.track(state, trim=False)
+
+
+def load_older_history(state: MutableMapping, username: str) -> int:
+    """
+    Page the next batch of older messages from the store into the session.
+
+    :param state: The session state holding `messages`.
+    :param username: The authenticated user.
+    :return: The number of messages loaded.
+    """
+    older = get_session_store().load_older(
+        username, DEFAULT_CONVERSATION, state.get(OLDEST_SEQ_KEY), SESSION_LOAD_MESSAGES
+    )
+    messages = state["messages"]
+    # Keep the system prompt at the head of the history
+    head = 1 if messages and messages[0]["role"] == "system" else 0
+    messages[head:head] = older
+    if older:
+        state[OLDEST_SEQ_KEY] = older[0].seq
+    state[HAS_OLDER_KEY] = len(older) == SESSION_LOAD_MESSAGES
+    return len(older)
+
+
+def save_turn(state: MutableMapping, username: str, count: int = 2) -> None:
+    """
+    Persist the last messages of the session, then enforce its memory budget.
+
+    :param state: The session state holding `messages`.
+    :param username: The authenticated user.
+    :param count: How many of the newest messages belong to the turn.
+    """
+    memory = get_chat_memory()
+    # Compact first, so the stored sequence numbers land on the kept records
+    memory.track(state, trim=False)
+    turn = state["messages"][-count:]
+    first_seq = get_session_store().append(username, DEFAULT_CONVERSATION, turn)
+    for offset, message in enumerate(turn):
+        message.seq = first_seq + offset
+
+    before_seq = memory.track(state)
+    if before_seq is not None:
+        # Messages dropped from memory are paged back in from the store
+        state[OLDEST_SEQ_KEY] = before_seq
+        state[HAS_OLDER_KEY] = True
+
+
+def clear_history(state: MutableMapping, username: str) -> None:
+    """
+    Delete the user's stored history and reset the session's copy.
+
+    :param state: The session state holding `messages`.
+    :param username: The authenticated user.
+    """
+    get_session_store().clear(username, DEFAULT_CONVERSATION)
+    state["messages"] = []
+    state[HISTORY_OWNER_KEY] = username
+    state[OLDEST_SEQ_KEY] = None
+    state[HAS_OLDER_KEY] = False
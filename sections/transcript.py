@@ -0,0 +1,75 @@
+import os
+from typing import Callable, List, Optional
+
+import streamlit as st
+
+# Number of most recent messages rendered on every rerun
+TRANSCRIPT_RECENT_MESSAGES = int(os.getenv("CHAT_TRANSCRIPT_RECENT", "20"))
+# Number of older messages revealed per "show earlier" click
+TRANSCRIPT_PAGE_SIZE = int(os.getenv("CHAT_TRANSCRIPT_PAGE_SIZE", "20"))
+
+# Session state key holding how many messages are currently expanded
+VISIBLE_MESSAGES_KEY = "transcript_visible_messages"
+
+
+def _show_more(step: int) -> None:
+    st.session_state[VISIBLE_MESSAGES_KEY] = (
+        st.session_state.get(VISIBLE_MESSAGES_KEY, TRANSCRIPT_RECENT_MESSAGES) + step
+    )
+
+
+def _show_recent() -> None:
+    st.session_state[VISIBLE_MESSAGES_KEY] = TRANSCRIPT_RECENT_MESSAGES
+
+
+def _load_earlier(load_older: Callable[[], int]) -> None:
+    # Messages paged in from the store are shown right away
+    _show_more(load_older())
+
+
+def render_transcript(
+    messages: List[dict], load_older: Optional[Callable[[], int]] = None
+) -> None:
+    """
+    Render the tail of a chat history, with older messages behind "show earlier".
+
+    Only the last `TRANSCRIPT_RECENT_MESSAGES` messages (plus any pages the user
+    expanded) are sent to the browser, so rerun cost stays flat as the history
+    grows. System messages are never displayed.
+
+    :param messages: The chat history, with the system prompt (if any) first.
+    :param load_older: Prepends older messages from storage to `messages` and
+        returns how many it added; None if there are no more to load.
+    """
+    visible = st.session_state.get(VISIBLE_MESSAGES_KEY, TRANSCRIPT_RECENT_MESSAGES)
+    start = max(len(messages) - visible, 0)
+
+    # The history keeps a single system prompt at its head, which is not shown
+    hidden = start
+    if hidden and messages[0]["role"] == "system":
+        hidden -= 1
+
+    if hidden:
+        st.button(
+            f"Show {min(TRANSCRIPT_PAGE_SIZE, hidden)} earlier messages "
+            f"({hidden} hidden)",
+            on_click=_show_more,
+            args=(TRANSCRIPT_PAGE_SIZE,),
+            key="transcript_show_more",
+        )
+    elif load_older is not None:
+        st.button(
+            "Load earlier messages from history",
+            on_click=_load_earlier,
+            args=(load_older,),
+            key="transcript_load_older",
+        )
+    elif visible > TRANSCRIPT_RECENT_MESSAGES:
+        st.button(
+            "Show recent messages only", on_click=_show_recent, key="transcript_reset"
+        )
+
+    for message in messages[start:]:
+        if message["role"] != "system":  # Skip displaying system messages
+            with st.chat_message(message["role"]):
+                st.markdown(message["content"])
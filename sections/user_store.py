@@ -0,0 +1,300 @@
+"""
+Credential storage for the authenticator.
+
+SQLite is the default backend: usernames are the primary key and emails are
+indexed, so `get_user` and `find_username_by_email` are O(log n), and WAL
+mode lets the sessions of one container read while another writes. WAL needs
+a local disk: it does not work on network file systems such as Azure Files,
+so the database cannot be shared between containers. The YAML backend keeps
+the original config.yaml behaviour.
+
+One-shot import of an existing config.yaml:
+
+    python -m sections.user_store import config.yaml --db users.db
+"""
+
+import argparse
+import json
+import os
+import re
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from typing import Dict, Optional
+
+import bcrypt
+import yaml
+from yaml.loader import SafeLoader
+
+AUTH_BACKEND = os.getenv("AUTH_BACKEND", "sqlite")
+AUTH_DB_PATH = os.getenv("AUTH_DB_PATH", "users.db")
+AUTH_CONFIG_PATH = os.getenv("AUTH_CONFIG_PATH", "config.yaml")
+
+# Columns stored directly; any other user field goes into the `extra` JSON
+_USER_COLUMNS = ("email", "name", "password")
+# Per-process login bookkeeping that the authenticator keeps in the dict
+_TRANSIENT_FIELDS = ("logged_in", "failed_login_attempts")
+
+_BCRYPT_HASH = re.compile(r"^\$2[aby]\$\d+\$.{53}$")
+
+
+class CredentialBackend(ABC):
+    """Interface of a credential store used by the authenticator."""
+
+    @abstractmethod
+    def load_credentials(self) -> dict:
+        """
+        Return every user in the authenticator's format.
+
+        :return: A dictionary `{"usernames": {username: {...}}}`.
+        """
+
+    @abstractmethod
+    def get_user(self, username: str) -> Optional[dict]:
+        """
+        Look up one user.
+
+        :param username: The username.
+        :return: The user's fields, or None if there is no such user.
+        """
+
+    @abstractmethod
+    def find_username_by_email(self, email: str) -> Optional[str]:
+        """
+        Look up a username from an email address.
+
+        :param email: The email address.
+        :return: The username, or None if no user has this email.
+        """
+
+    @abstractmethod
+    def save_user(self, username: str, user: dict) -> None:
+        """
+        Create or update one user.
+
+        :param username: The username.
+        :param user: The user's fields (email, name, password hash, ...).
+        """
+
+    @abstractmethod
+    def version(self) -> int:
+        """
+        Return a value that changes whenever any user is written.
+
+        :return: The current version, used to invalidate cached credentials.
+        """
+
+
+class SQLiteCredentialBackend(CredentialBackend):
+    """Credentials in a SQLite database, indexed on username and email."""
+
+    def __init__(self, path: str = AUTH_DB_PATH):
+        self.path = path
+        self._local = threading.local()
+        db = self._connection()
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS users ("
+            "username TEXT PRIMARY KEY, email TEXT, name TEXT, "
+            "password TEXT NOT NULL, extra TEXT NOT NULL DEFAULT '{}')"
+        )
+        db.execute("CREATE INDEX IF NOT EXISTS users_email ON users (email)")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value INTEGER)"
+        )
+        db.execute("INSERT OR IGNORE INTO meta VALUES ('version', 0)")
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections must not be shared between threads
+        db = getattr(self._local, "db", None)
+        if db is None:
+            # Autocommit mode: transactions are opened explicitly in save_users
+            db = sqlite3.connect(self.path, timeout=30, isolation_level=None)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA busy_timeout=30000")
+            self._local.db = db
+        return db
+
+    @staticmethod
+    def _to_user(row: tuple) -> dict:
+        email, name, password, extra = row
+        user = json.loads(extra)
+        user.update({"email": email, "name": name, "password": password})
+        return user
+
+    def load_credentials(self) -> dict:
+        rows = self._connection().execute(
+            "SELECT username, email, name, password, extra FROM users"
+        )
+        return {"usernames": {row[0]: self._to_user(row[1:]) for row in rows}}
+
+    def get_user(self, username: str) -> Optional[dict]:
+        row = (
+            self._connection()
+            .execute(
+                "SELECT email, name, password, extra FROM users WHERE username = ?",
+                (username,),
+            )
+            .fetchone()
+        )
+        return None if row is None else self._to_user(row)
+
+    def find_username_by_email(self, email: str) -> Optional[str]:
+        row = (
+            self._connection()
+            .execute("SELECT username FROM users WHERE email = ?", (email,))
+            .fetchone()
+        )
+        return None if row is None else row[0]
+
+    def save_user(self, username: str, user: dict) -> None:
+        self.save_users({username: user})
+
+    def save_users(self, users: Dict[str, dict]) -> None:
+        """
+        Create or update several users in one transaction.
+
+        :param users: Mapping of username to the user's fields.
+        """
+        rows = []
+        for username, user in users.items():
+            extra = {
+                key: value
+                for key, value in user.items()
+                if key not in _USER_COLUMNS and key not in _TRANSIENT_FIELDS
+            }
+            rows.append(
+                (
+                    username,
+                    user.get("email"),
+                    user.get("name"),
+                    user["password"],
+                    json.dumps(extra),
+                )
+            )
+
+        db = self._connection()
+        # IMMEDIATE takes the write lock up front so concurrent writers queue
+        db.execute("BEGIN IMMEDIATE")
+        try:
+            db.executemany(
+                "INSERT INTO users VALUES (?, ?, ?, ?, ?) ON CONFLICT(username) DO "
+                "UPDATE SET email = excluded.email, name = excluded.name, "
+                "password = excluded.password, extra = excluded.extra",
+                rows,
+            )
+            db.execute("UPDATE meta SET value = value + 1 WHERE key = 'version'")
+            db.execute("COMMIT")
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+
+    def version(self) -> int:
+        return (
+            self._connection()
+            .execute("SELECT value FROM meta WHERE key = 'version'")
+            .fetchone()[0]
+        )
+
+    def is_empty(self) -> bool:
+        row = self._connection().execute("SELECT 1 FROM users LIMIT 1").fetchone()
+        return row is None
+
+    def import_yaml(self, path: str) -> int:
+        """
+        Import the users of a config.yaml file, overwriting existing entries.
+
+        :param path: The path to the YAML config.
+        :return: The number of users imported.
+        """
+        with open(path) as file:
+            config = yaml.load(file, Loader=SafeLoader)
+        users = (config.get("credentials") or {}).get("usernames") or {}
+        users = {username.lower(): dict(user) for username, user in users.items()}
+        for user in users.values():
+            # Store hashes only, so the authenticator never has to hash at login time
+            if not _BCRYPT_HASH.match(str(user["password"])):
+                user["password"] = bcrypt.hashpw(
+                    str(user["password"]).encode(), bcrypt.gensalt()
+                ).decode()
+        if users:
+            self.save_users(users)
+        return len(users)
+
+
+class YAMLCredentialBackend(CredentialBackend):
+    """Credentials kept in the `credentials` section of config.yaml."""
+
+    def __init__(self, path: str = AUTH_CONFIG_PATH):
+        self.path = path
+        self._lock = threading.Lock()
+
+    def _read(self) -> dict:
+        with open(self.path) as file:
+            return yaml.load(file, Loader=SafeLoader)
+
+    def load_credentials(self) -> dict:
+        return self._read()["credentials"]
+
+    def get_user(self, username: str) -> Optional[dict]:
+        return self.load_credentials()["usernames"].get(username)
+
+    def find_username_by_email(self, email: str) -> Optional[str]:
+        for username, user in self.load_credentials()["usernames"].items():
+            if user.get("email") == email:
+                return username
+        return None
+
+    def save_user(self, username: str, user: dict) -> None:
+        with self._lock:
+            config = self._read()
+            config["credentials"]["usernames"][username] = {
+                key: value for key, value in user.items() if key not in _TRANSIENT_FIELDS
+            }
+            with open(self.path, "w") as file:
+                yaml.dump(config, file, default_flow_style=False)
+
+    def version(self) -> int:
+        return os.stat(self.path).st_mtime_ns
+
+
+_backend: Optional[CredentialBackend] = None
+_backend_lock = threading.Lock()
+
+
+def get_credential_backend() -> CredentialBackend:
+    """
+    Return the process-wide credential backend selected by `AUTH_BACKEND`.
+
+    A new, empty SQLite database is seeded from config.yaml on first use.
+
+    :return: The shared backend.
+    """
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if AUTH_BACKEND == "yaml":
+                    _backend = YAMLCredentialBackend()
+                else:
+                    backend = SQLiteCredentialBackend()
+                    if backend.is_empty() and os.path.exists(AUTH_CONFIG_PATH):
+                        backend.import_yaml(AUTH_CONFIG_PATH)
+                    _backend = backend
+    return _backend
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Manage the SQLite user store.")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    importer = subparsers.add_parser("import", help="import users from config.yaml")
+    importer.add_argument("config", nargs="?", default=AUTH_CONFIG_PATH)
+    importer.add_argument("--db", default=AUTH_DB_PATH)
+    args = parser.parse_args()
+
+    if args.command == "import":
+        count = SQLiteCredentialBackend(args.db).import_yaml(args.config)
+        print(f"Imported {count} users from {args.config} into {args.db}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+import threading
+import time
+
+import bcrypt
+import pytest
+
+from sections import login
+from sections.login import (
+    LoginBusyError,
+    LoginRateLimitedError,
+    RateLimiter,
+    VerifiedLogins,
+    client_address,
+    verify_password,
+)
+
+# Minimum cost: these tests check the login flow, not hashing strength
+PASSWORD_HASH = bcrypt.hashpw(b"secret", bcrypt.gensalt(4)).decode()
+
+
+class Clock:
+    """A controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(login.time, "monotonic", clock)
+    return clock
+
+
+@pytest.fixture(autouse=True)
+def fresh_limits(monkeypatch):
+    # Module-level limiters and caches would leak failures between tests
+    monkeypatch.setattr(login, "_user_limiter", RateLimiter(3, 60))
+    monkeypatch.setattr(login, "_ip_limiter", RateLimiter(5, 60))
+    monkeypatch.setattr(login, "_verified", VerifiedLogins())
+
+
+def test_rate_limiter_blocks_after_max_failures(clock):
+    limiter = RateLimiter(max_failures=2, window_seconds=60)
+    limiter.record_failure("alice")
+    assert limiter.retry_after("alice") == 0
+
+    limiter.record_failure("alice")
+    assert limiter.retry_after("alice") == 60
+    assert limiter.retry_after("bob") == 0
+
+
+def test_rate_limiter_window_slides(clock):
+    limiter = RateLimiter(max_failures=2, window_seconds=60)
+    limiter.record_failure("alice")
+    clock.now += 30
+    limiter.record_failure("alice")
+    assert limiter.retry_after("alice") == 30
+
+    clock.now += 31  # The first failure left the window
+    assert limiter.retry_after("alice") == 0
+
+
+def test_rate_limiter_reset(clock):
+    limiter = RateLimiter(max_failures=1, window_seconds=60)
+    limiter.record_failure("alice")
+    limiter.reset("alice")
+    assert limiter.retry_after("alice") == 0
+
+
+def test_rate_limiter_bounds_tracked_keys(clock, monkeypatch):
+    monkeypatch.setattr(login, "_MAX_TRACKED_KEYS", 3)
+    limiter = RateLimiter(max_failures=1, window_seconds=60)
+    limiter.record_failure("victim")
+    for i in range(10):
+        # Keys within the window: only the LRU bound can drop them
+        limiter.record_failure(f"spoofed-{i}")
+    assert len(limiter._failures) == 3
+
+    # A key failing again becomes the most recent and survives
+    limiter.record_failure("spoofed-7")
+    limiter.record_failure("new")
+    assert "spoofed-7" in limiter._failures
+    assert "spoofed-8" not in limiter._failures
+
+
+def test_rate_limiter_prunes_expired_keys_first(clock, monkeypatch):
+    monkeypatch.setattr(login, "_MAX_TRACKED_KEYS", 2)
+    limiter = RateLimiter(max_failures=1, window_seconds=60)
+    limiter.record_failure("old")
+    clock.now += 10
+    limiter.record_failure("recent")
+    clock.now += 55  # "old" expired, "recent" has not
+
+    limiter.record_failure("new")
+    assert set(limiter._failures) == {"recent", "new"}
+
+
+@pytest.mark.parametrize(
+    "forwarded, expected",
+    [
+        ("203.0.113.7:51234", "203.0.113.7"),
+        # Entries left of the proxy's hop are client-controlled
+        ("1.1.1.1, 203.0.113.7:51234", "203.0.113.7"),
+        ("[2001:db8::1]:51234", "2001:db8::1"),
+        ("2001:db8::1", "2001:db8::1"),
+        (None, "10.0.0.5"),
+        ("", "10.0.0.5"),
+    ],
+)
+def test_client_address_uses_the_trusted_hop(forwarded, expected):
+    assert client_address(forwarded, "10.0.0.5") == expected
+
+
+def test_client_address_with_two_trusted_proxies(monkeypatch):
+    monkeypatch.setattr(login, "LOGIN_TRUSTED_PROXIES", 2)
+    assert client_address("9.9.9.9, 203.0.113.7, 10.1.1.1", None) == "203.0.113.7"
+    # Fewer hops than trusted proxies: the header cannot be trusted at all
+    assert client_address("9.9.9.9", None) == "unknown"
+
+
+def test_verify_password(clock):
+    assert verify_password("alice", "secret", PASSWORD_HASH, "ip", 60)
+    assert not verify_password("alice", "wrong", PASSWORD_HASH, "ip", 60)
+    assert not verify_password("nobody", "secret", None, "ip", 60)
+
+
+def test_failed_logins_lock_the_username(clock):
+    for _ in range(3):
+        assert not verify_password("alice", "wrong", PASSWORD_HASH, "ip", 60)
+
+    with pytest.raises(LoginRateLimitedError):
+        verify_password("alice", "secret", PASSWORD_HASH, "other-ip", 60)
+
+    clock.now += 61
+    assert verify_password("alice", "secret", PASSWORD_HASH, "ip", 60)
+
+
+def test_failed_logins_lock_the_client(clock):
+    for i in range(5):
+        verify_password(f"user-{i}", "wrong", None, "attacker", 60)
+
+    with pytest.raises(LoginRateLimitedError):
+        verify_password("alice", "secret", PASSWORD_HASH, "attacker", 60)
+    assert verify_password("alice", "secret", PASSWORD_HASH, "elsewhere", 60)
+
+
+def test_successful_login_is_remembered(monkeypatch):
+    checks = []
+    check_in_pool = login._check_in_pool
+
+    def counting_check(password, password_hash):
+        checks.append(password)
+        return check_in_pool(password, password_hash)
+
+    monkeypatch.setattr(login, "_check_in_pool", counting_check)
+    assert verify_password("alice", "secret", PASSWORD_HASH, "ip", 60)
+    assert verify_password("alice", "secret", PASSWORD_HASH, "ip", 60)
+    assert len(checks) == 1
+
+    # A different password, or a changed hash, is checked again
+    assert not verify_password("alice", "other", PASSWORD_HASH, "ip", 60)
+    new_hash = bcrypt.hashpw(b"secret", bcrypt.gensalt(4)).decode()
+    assert verify_password("alice", "secret", new_hash, "ip", 60)
+    assert len(checks) == 3
+
+
+def test_timed_out_check_keeps_its_slot_until_it_ends(monkeypatch):
+    release = threading.Event()
+
+    def slow_checkpw(password, password_hash):
+        release.wait(5)
+        return True
+
+    pending = threading.BoundedSemaphore(1)
+    monkeypatch.setattr(login, "_pending", pending)
+    monkeypatch.setattr(login, "LOGIN_VERIFY_TIMEOUT", 0.05)
+    monkeypatch.setattr(login.bcrypt, "checkpw", slow_checkpw)
+
+    with pytest.raises(LoginBusyError, match="too long"):
+        login._check_in_pool("secret", b"hash")
+    # The check is still running, so the only slot is still taken
+    with pytest.raises(LoginBusyError, match="in progress"):
+        login._check_in_pool("secret", b"hash")
+
+    release.set()
+    deadline = time.monotonic() + 5
+    while not pending.acquire(blocking=False):
+        assert time.monotonic() < deadline, "slot was never released"
+        time.sleep(0.01)
+    pending.release()
@@ -0,0 +1,101 @@
+import time
+
+import numpy as np
+import pytest
+
+from sections.semantic_cache import SemanticCache, embed_text, normalize_words
+
+
+@pytest.fixture
+def cache():
+    return SemanticCache(max_entries=8, threshold=0.97, ttl=3600, dim=1024)
+
+
+def test_embedding_is_unit_length():
+    assert np.linalg.norm(embed_text("sort a list")) == pytest.approx(1.0)
+    assert not embed_text("").any()
+
+
+def test_normalize_words_drops_case_punctuation_and_articles():
+    assert normalize_words("What is a Large-Language model?") == [
+        "what",
+        "is",
+        "large",
+        "language",
+        "model",
+    ]
+
+
+@pytest.mark.parametrize(
+    "cached, asked",
+    [
+        ("What is large language model?", "what is a large-language model"),
+        ("How do I reverse a string in Python?", "how do i reverse a string in python"),
+        ("Explain supervised learning.", "explain  supervised learning"),
+    ],
+)
+def test_rewordings_hit(cache, cached, asked):
+    cache.add("ns", cached, "answer")
+    response, similarity = cache.lookup("ns", asked)
+    assert response == "answer"
+    assert similarity == pytest.approx(1.0)
+
+
+@pytest.mark.parametrize(
+    "cached, asked",
+    [
+        # Same words, swapped: the trigram embedding scores these 0.9 to 1
+        (
+            "Write a Python function that converts a list of strings to a list "
+            "of integers",
+            "Write a Python function that converts a list of integers to a list "
+            "of strings",
+        ),
+        ("convert celsius to fahrenheit", "convert fahrenheit to celsius"),
+        ("merge branch main into feature", "merge branch feature into main"),
+        ("reverse a string in python", "in python reverse a string"),
+        # A changed or added word
+        ("sort a list ascending", "sort a list descending"),
+        ("what is supervised learning", "what is unsupervised learning"),
+        ("what is large language model", "what is large language model not"),
+    ],
+)
+def test_different_prompts_miss(cache, cached, asked):
+    cache.add("ns", cached, "answer")
+    assert cache.lookup("ns", asked) is None
+
+
+def test_swapped_words_are_invisible_to_the_embedding():
+    # Why the cache compares word order on top of the similarity
+    a = "converts a list of strings to a list of integers"
+    b = "converts a list of integers to a list of strings"
+    assert float(embed_text(a) @ embed_text(b)) == pytest.approx(1.0)
+
+
+def test_namespaces_are_separate(cache):
+    cache.add("model-a", "what is an llm", "answer")
+    assert cache.lookup("model-b", "what is an llm") is None
+    assert cache.lookup("model-a", "what is an llm")[0] == "answer"
+
+
+def test_expired_entries_miss(cache, monkeypatch):
+    cache.add("ns", "what is an llm", "answer")
+    later = time.time() + cache.ttl + 1
+    monkeypatch.setattr("sections.semantic_cache.time.time", lambda: later)
+    assert cache.lookup("ns", "what is an llm") is None
+
+
+def test_least_recently_used_entry_is_replaced_when_full():
+    cache = SemanticCache(max_entries=2, threshold=0.97, ttl=3600, dim=256)
+    cache.add("ns", "first prompt", "1")
+    time.sleep(0.01)
+    cache.add("ns", "second prompt", "2")
+    time.sleep(0.01)
+    cache.lookup("ns", "first prompt")  # Now the most recently used
+    time.sleep(0.01)
+    cache.add("ns", "third prompt", "3")
+
+    assert cache.lookup("ns", "second prompt") is None
+    assert cache.lookup("ns", "first prompt")[0] == "1"
+    assert cache.lookup("ns", "third prompt")[0] == "3"
+    assert cache.stats()["evictions"] == 1
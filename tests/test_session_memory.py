@@ -0,0 +1,155 @@
+import gc
+
+from sections import session_memory
+from sections.session_memory import (
+    ChatHistory,
+    ChatMemory,
+    ChatMessage,
+    compact_messages,
+)
+
+
+class Clock:
+    """A controllable stand-in for time.monotonic."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _history(turns: int, saved: bool = True, size: int = 100) -> list:
+    messages = [{"role": "system", "content": "be brief"}]
+    for i in range(2 * turns):
+        role = "user" if i % 2 == 0 else "assistant"
+        messages.append(ChatMessage(role, "x" * size, i if saved else None))
+    return messages
+
+
+def _bytes(messages) -> int:
+    return sum(m.size() for m in compact_messages(messages))
+
+
+def test_chat_message_reads_like_a_dict():
+    message = ChatMessage.from_dict({"role": "user", "content": "hi"})
+    assert dict(message) == {"role": "user", "content": "hi"}
+    assert message.seq is None
+
+    message["content"] = "hello"
+    assert message["content"] == "hello"
+    # Roles are interned, so every message shares one string per role
+    assert ChatMessage("".join(["us", "er"]), "").role is message.role
+
+
+def test_compact_messages_keeps_existing_records():
+    record = ChatMessage("assistant", "a", 3)
+    history = compact_messages([{"role": "user", "content": "q"}, record])
+    assert isinstance(history, ChatHistory)
+    assert history[1] is record
+
+
+def test_track_under_budget_keeps_everything():
+    memory = ChatMemory(session_budget=10**6, process_budget=10**9)
+    state = {"messages": _history(5)}
+    assert memory.track(state) is None
+    assert len(state["messages"]) == 11
+    assert isinstance(state["messages"], ChatHistory)
+
+
+def test_trim_drops_oldest_saved_messages():
+    state = {"messages": _history(10)}
+    budget = _bytes(state["messages"]) // 2
+    memory = ChatMemory(session_budget=budget, process_budget=10**9)
+
+    before_seq = memory.track(state)
+
+    messages = state["messages"]
+    assert _bytes(messages) <= budget
+    assert messages[0].role == "system"
+    assert messages[-1].seq == 19
+    # The store pages back in from just after the newest dropped message
+    assert before_seq == messages[1].seq
+    assert memory.stats()["trimmed_messages"] == before_seq
+
+
+def test_trim_keeps_unsaved_messages_and_still_enforces_the_budget():
+    state = {"messages": _history(1, saved=False) + _history(20)[1:]}
+    budget = _bytes(state["messages"]) // 3
+    memory = ChatMemory(session_budget=budget, process_budget=10**9)
+
+    memory.track(state)
+
+    messages = state["messages"]
+    assert [m.seq for m in messages[1:3]] == [None, None]
+    assert _bytes(messages) <= budget
+    assert memory.stats()["trimmed_messages"] > 0
+
+
+def test_trim_keeps_the_newest_message_even_over_budget():
+    state = {"messages": _history(1, size=10_000)}
+    memory = ChatMemory(session_budget=100, process_budget=10**9)
+
+    before_seq = memory.track(state)
+
+    assert [m.seq for m in state["messages"]] == [None, 1]
+    assert before_seq == 1
+
+
+def test_track_without_trim_only_accounts():
+    state = {"messages": _history(10)}
+    memory = ChatMemory(session_budget=100, process_budget=10**9)
+    assert memory.track(state, trim=False) is None
+    assert len(state["messages"]) == 21
+    assert memory.stats()["total_bytes"] == _bytes(state["messages"])
+
+
+def test_idle_sessions_are_evicted_over_the_process_budget(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_memory.time, "monotonic", clock)
+    one_session = _bytes(_history(5))
+    memory = ChatMemory(
+        session_budget=10**6, process_budget=2 * one_session, idle_seconds=60
+    )
+
+    idle, active, new = ({"messages": _history(5)} for _ in range(3))
+    memory.track(idle)
+    clock.now += 120
+    memory.track(active)
+    memory.track(new)
+
+    assert idle["messages"] == []
+    assert memory.was_evicted(idle)
+    assert not memory.was_evicted(idle)  # Reported once
+    assert len(active["messages"]) == 11 and not memory.was_evicted(active)
+    stats = memory.stats()
+    assert stats["evicted_sessions"] == 1
+    assert stats["sessions"] == 2
+    assert stats["total_bytes"] == 2 * one_session
+
+
+def test_recently_active_sessions_are_not_evicted(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(session_memory.time, "monotonic", clock)
+    memory = ChatMemory(session_budget=10**6, process_budget=1, idle_seconds=60)
+
+    first, second = {"messages": _history(5)}, {"messages": _history(5)}
+    memory.track(first)
+    clock.now += 30
+    memory.track(second)
+
+    assert len(first["messages"]) == 11
+    assert memory.stats()["evicted_sessions"] == 0
+
+
+def test_ended_sessions_leave_the_gauge():
+    memory = ChatMemory(session_budget=10**6, process_budget=10**9)
+    state = {"messages": _history(5)}
+    memory.track(state)
+    assert memory.stats()["sessions"] == 1
+
+    del state
+    gc.collect()
+    stats = memory.stats()
+    assert stats["sessions"] == 0
+    assert stats["total_bytes"] == 0
@@ -0,0 +1,198 @@
+import threading
+
+import pytest
+
+from sections import session_store
+from sections.session_memory import ChatMemory
+from sections.session_store import (
+    HAS_OLDER_KEY,
+    OLDEST_SEQ_KEY,
+    RedisSessionStore,
+    SessionStore,
+    SQLiteSessionStore,
+)
+
+
+def _turn(i: int) -> list:
+    return [
+        {"role": "user", "content": f"question {i}"},
+        {"role": "assistant", "content": f"answer {i}"},
+    ]
+
+
+@pytest.fixture(params=["sqlite", "redis"])
+def make_store(request, tmp_path):
+    """Build stores of one backend that share the same storage."""
+    if request.param == "sqlite":
+        path = str(tmp_path / "sessions.db")
+        return lambda max_messages=1000: SQLiteSessionStore(path, max_messages)
+
+    fakeredis = pytest.importorskip("fakeredis")
+    server = fakeredis.FakeServer()
+    return lambda max_messages=1000: RedisSessionStore(
+        fakeredis.FakeRedis(server=server), max_messages
+    )
+
+
+def test_append_returns_consecutive_sequence_numbers(make_store):
+    store = make_store()
+    assert store.append("alice", "chat", _turn(0)) == 0
+    assert store.append("alice", "chat", _turn(1)) == 2
+    # Users and conversations are numbered independently
+    assert store.append("bob", "chat", _turn(0)) == 0
+    assert store.append("alice", "other", _turn(0)) == 0
+
+
+def test_load_older_pages_backwards(make_store):
+    store = make_store()
+    for i in range(5):
+        store.append("alice", "chat", _turn(i))
+
+    newest = store.load_older("alice", "chat", None, 3)
+    assert [(m.seq, m["content"]) for m in newest] == [
+        (7, "answer 3"),
+        (8, "question 4"),
+        (9, "answer 4"),
+    ]
+    older = store.load_older("alice", "chat", newest[0].seq, 3)
+    assert [m.seq for m in older] == [4, 5, 6]
+    oldest = store.load_older("alice", "chat", 2, 10)
+    assert [m["role"] for m in oldest] == ["user", "assistant"]
+    assert store.load_older("alice", "chat", 0, 10) == []
+    assert store.load_older("nobody", "chat", None, 10) == []
+
+
+def test_identical_messages_are_all_kept(make_store):
+    store = make_store()
+    store.append("alice", "chat", _turn(0))
+    store.append("alice", "chat", _turn(0))
+    assert len(store.load_older("alice", "chat", None, 10)) == 4
+
+
+def test_compaction_keeps_the_newest_messages(make_store):
+    store = make_store(max_messages=3)
+    for i in range(4):
+        store.append("alice", "chat", _turn(i))
+
+    messages = store.load_older("alice", "chat", None, 10)
+    # Sequence numbers stay stable after compaction
+    assert [m.seq for m in messages] == [5, 6, 7]
+    assert store.append("alice", "chat", _turn(4)) == 8
+
+
+def test_clear(make_store):
+    store = make_store()
+    store.append("alice", "chat", _turn(0))
+    store.append("bob", "chat", _turn(0))
+    store.clear("alice", "chat")
+
+    assert store.load_older("alice", "chat", None, 10) == []
+    assert len(store.load_older("bob", "chat", None, 10)) == 2
+
+
+def test_concurrent_appends_get_distinct_sequence_numbers(make_store):
+    # One store per thread, like several replicas sharing the backend
+    stores = [make_store(max_messages=1000) for _ in range(4)]
+    firsts = []
+
+    def append_turns(store):
+        for i in range(25):
+            firsts.append(store.append("alice", "chat", _turn(i)))
+
+    threads = [threading.Thread(target=append_turns, args=(s,)) for s in stores]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(firsts) == list(range(0, 200, 2))
+    messages = stores[0].load_older("alice", "chat", None, 1000)
+    assert [m.seq for m in messages] == list(range(200))
+
+
+def test_incomplete_store_cannot_be_created():
+    class NoClear(SessionStore):
+        def append(self, username, conversation, messages):
+            return 0
+
+        def load_older(self, username, conversation, before_seq, limit):
+            return []
+
+    with pytest.raises(TypeError, match="clear"):
+        NoClear()
+
+
+@pytest.fixture
+def sqlite_store(monkeypatch, tmp_path):
+    store = SQLiteSessionStore(str(tmp_path / "sessions.db"))
+    monkeypatch.setattr(session_store, "_store", store)
+    monkeypatch.setattr(session_store, "SESSION_LOAD_MESSAGES", 4)
+    monkeypatch.setattr(
+        session_store, "get_chat_memory", lambda: ChatMemory(10**6, 10**9, 300)
+    )
+    return store
+
+
+def test_save_restore_and_page_in_history(sqlite_store):
+    state = {"messages": [{"role": "system", "content": "be brief"}]}
+    for i in range(3):
+        state["messages"].extend(_turn(i))
+        session_store.save_turn(state, "alice")
+    assert [m.seq for m in state["messages"][1:]] == list(range(6))
+
+    # A new session starts from the most recent messages only
+    new_state = {}
+    session_store.restore_history(new_state, "alice")
+    assert [m.seq for m in new_state["messages"]] == [2, 3, 4, 5]
+    assert new_state[OLDEST_SEQ_KEY] == 2
+    assert new_state[HAS_OLDER_KEY]
+
+    new_state["messages"].insert(0, state["messages"][0])
+    assert session_store.load_older_history(new_state, "alice") == 2
+    assert new_state["messages"][0]["role"] == "system"
+    assert [m.seq for m in new_state["messages"][1:]] == list(range(6))
+    assert not new_state[HAS_OLDER_KEY]
+
+
+def test_restore_keeps_the_users_own_history(sqlite_store):
+    state = {}
+    session_store.restore_history(state, "alice")
+    state["messages"].extend(_turn(0))
+    session_store.save_turn(state, "alice")
+    messages = state["messages"]
+
+    session_store.restore_history(state, "alice")
+    assert state["messages"] is messages
+
+
+def test_restore_replaces_another_users_history(sqlite_store):
+    for i in range(3):
+        sqlite_store.append("bob", session_store.DEFAULT_CONVERSATION, _turn(i))
+    state = {}
+    session_store.restore_history(state, "alice")
+    state["messages"].extend(_turn(0))
+    session_store.save_turn(state, "alice")
+    state[OLDEST_SEQ_KEY], state[HAS_OLDER_KEY] = 0, True
+
+    # Logging out keeps session state: the next user on this tab is bob
+    session_store.restore_history(state, "bob")
+
+    assert [m["content"] for m in state["messages"]] == [
+        "question 1",
+        "answer 1",
+        "question 2",
+        "answer 2",
+    ]
+    assert state[session_store.HISTORY_OWNER_KEY] == "bob"
+    assert state[OLDEST_SEQ_KEY] == 2
+    assert state[HAS_OLDER_KEY]
+
+
+def test_clear_history(sqlite_store):
+    state = {"messages": _turn(0)}
+    session_store.save_turn(state, "alice")
+    session_store.clear_history(state, "alice")
+
+    assert state["messages"] == []
+    conversation = session_store.DEFAULT_CONVERSATION
+    assert sqlite_store.load_older("alice", conversation, None, 10) == []
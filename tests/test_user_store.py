@@ -0,0 +1,120 @@
+import bcrypt
+import pytest
+import yaml
+
+from sections.user_store import CredentialBackend, SQLiteCredentialBackend
+
+
+def _hash(password: str) -> str:
+    # Minimum cost: these tests check storage, not hashing strength
+    return bcrypt.hashpw(password.encode(), bcrypt.gensalt(4)).decode()
+
+
+@pytest.fixture
+def backend(tmp_path):
+    return SQLiteCredentialBackend(str(tmp_path / "users.db"))
+
+
+def test_save_and_load_user(backend):
+    user = {"email": "a@example.com", "name": "Alice", "password": _hash("pw")}
+    backend.save_user("alice", user)
+
+    assert backend.get_user("alice") == user
+    assert backend.load_credentials() == {"usernames": {"alice": user}}
+    assert backend.get_user("bob") is None
+
+
+def test_find_username_by_email(backend):
+    backend.save_user("alice", {"email": "a@example.com", "name": "A", "password": "h"})
+
+    assert backend.find_username_by_email("a@example.com") == "alice"
+    assert backend.find_username_by_email("b@example.com") is None
+
+
+def test_save_updates_existing_user(backend):
+    backend.save_user("alice", {"email": "a@example.com", "name": "A", "password": "1"})
+    backend.save_user("alice", {"email": "b@example.com", "name": "A", "password": "2"})
+
+    assert backend.get_user("alice")["password"] == "2"
+    assert backend.find_username_by_email("a@example.com") is None
+    assert len(backend.load_credentials()["usernames"]) == 1
+
+
+def test_extra_fields_kept_and_transient_fields_dropped(backend):
+    backend.save_user(
+        "alice",
+        {
+            "email": "a@example.com",
+            "name": "A",
+            "password": "h",
+            "roles": ["admin"],
+            "logged_in": True,
+            "failed_login_attempts": 3,
+        },
+    )
+
+    user = backend.get_user("alice")
+    assert user["roles"] == ["admin"]
+    assert "logged_in" not in user
+    assert "failed_login_attempts" not in user
+
+
+def test_version_changes_on_every_write(backend):
+    versions = [backend.version()]
+    for password in ("1", "2"):
+        backend.save_user("alice", {"email": None, "name": "A", "password": password})
+        versions.append(backend.version())
+
+    assert versions[0] < versions[1] < versions[2]
+
+
+def test_version_is_shared_between_connections(tmp_path):
+    path = str(tmp_path / "users.db")
+    reader, writer = SQLiteCredentialBackend(path), SQLiteCredentialBackend(path)
+    before = reader.version()
+
+    writer.save_user("alice", {"email": None, "name": "A", "password": "h"})
+
+    assert reader.version() != before
+    assert reader.get_user("alice") is not None
+
+
+def test_import_yaml_hashes_plain_passwords(backend, tmp_path):
+    hashed = _hash("secret")
+    config = tmp_path / "config.yaml"
+    config.write_text(
+        yaml.dump(
+            {
+                "credentials": {
+                    "usernames": {
+                        "Alice": {"email": "a@x.com", "name": "A", "password": "pw"},
+                        "bob": {"email": "b@x.com", "name": "B", "password": hashed},
+                    }
+                }
+            }
+        )
+    )
+
+    assert backend.import_yaml(str(config)) == 2
+    alice = backend.get_user("alice")  # Usernames are lowercased
+    assert bcrypt.checkpw(b"pw", alice["password"].encode())
+    assert backend.get_user("bob")["password"] == hashed
+    assert backend.is_empty() is False
+
+
+def test_incomplete_backend_cannot_be_created():
+    class NoVersion(CredentialBackend):
+        def load_credentials(self):
+            return {"usernames": {}}
+
+        def get_user(self, username):
+            return None
+
+        def find_username_by_email(self, email):
+            return None
+
+        def save_user(self, username, user):
+            pass
+
+    with pytest.raises(TypeError, match="version"):
+        NoVersion()